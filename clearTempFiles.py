@@ -1,12 +1,29 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-def delete_temp_files(directories=None):
+# Extensions of the intermediate files left behind by the scrape/process steps.
+# A tuple lets str.endswith check them all in one call.
+TEMP_FILE_EXTENSIONS = (".html", ".xml", ".csv")
+# Number of threads issuing unlink() calls concurrently
+DELETE_WORKERS = 16
+
+def _safe_remove(filepath):
+    """Deletes a single file. Returns None on success or the OSError raised."""
+    try:
+        os.unlink(filepath)
+    except OSError as e:
+        return e
+    return None
+
+def delete_temp_files(directories=None, verbose=False):
     """
     Deletes all .html and .xml files from the specified list of directories.
 
     Args:
         directories (list): A list of directory paths to clean.
                             Defaults to ['team_CSV', 'team_tables'] if None.
+        verbose (bool): Print every deleted file. Off by default, since a print
+                        per file dominates the loop on large directories.
     """
     if directories is None:
         directories = ['team_CSV', 'team_tables']
@@ -15,6 +32,8 @@ def delete_temp_files(directories=None):
 
     files_deleted_count = 0
     directories_processed_count = 0
+    failed_deletions = [] # (path, error) pairs, reported once in the summary
+    paths_to_delete = []
 
     for directory in directories:
         if not os.path.isdir(directory):
@@ -24,25 +43,38 @@ def delete_temp_files(directories=None):
         directories_processed_count += 1
         print(f"\nProcessing directory: '{directory}'")
 
-        for filename in os.listdir(directory):
-            filepath = os.path.join(directory, filename)
-            
-            if os.path.isfile(filepath):
-                if filename.endswith(".html") or filename.endswith(".xml") or filename.endswith(".csv"):
-                    try:
-                        os.remove(filepath)
-                        print(f"  Deleted: '{filename}'")
-                        files_deleted_count += 1
-                    except OSError as e:
-                        print(f"  Error deleting '{filename}': {e}")
+        # os.scandir hands back DirEntry objects with the file type already cached,
+        # so there is no extra stat() per entry like os.listdir + os.path.isfile.
+        # The name is checked first: it is a plain string test, and is_file() only has to
+        # fall back to stat() on filesystems that don't report the type in readdir.
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(TEMP_FILE_EXTENSIONS):
+                    if entry.is_file(follow_symlinks=False):
+                        paths_to_delete.append(entry.path)
+                    # else:
+                    #     print(f"  Skipped: '{entry.name}' (not a file)")
                 # else:
-                #     print(f"  Skipped: '{filename}' (not .html or .xml)")
-            # else:
-            #     print(f"  Skipped: '{filename}' (not a file)")
+                #     print(f"  Skipped: '{entry.name}' (not .html or .xml)")
+
+    # unlink() is a blocking syscall that releases the GIL, so a pool of threads overlaps
+    # the per-file latency (this matters most when the directories sit on a network share)
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        for filepath, error in zip(paths_to_delete, executor.map(_safe_remove, paths_to_delete)):
+            if error is None:
+                if verbose:
+                    print(f"  Deleted: '{filepath}'")
+                files_deleted_count += 1
+            else:
+                failed_deletions.append((filepath, error))
 
     print("\n--- Deletion Summary ---")
     print(f"Directories processed: {directories_processed_count}")
     print(f"Total files deleted: {files_deleted_count}")
+    if failed_deletions:
+        print(f"Files that could not be deleted: {len(failed_deletions)}")
+        for filepath, e in failed_deletions:
+            print(f"  Error deleting '{filepath}': {e}")
     print("Deletion process complete.")
 
 if __name__ == "__main__":
@@ -1,5 +1,30 @@
 import os
-import csv
+import mmap
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+# Buffer size for the master CSV output; the 8 KiB default means many more write() syscalls
+IO_BUFFER_SIZE = 1 << 20
+# Reader threads pre-loading team CSVs while the previous ones are written out.
+# Also caps how many file contents are held in memory at once.
+READER_WORKERS = 8
+
+def _read_team_csv(filepath):
+    """
+    Reads a team CSV and splits it into its header line and its body.
+    The file is memory-mapped so the header scan is a single mmap.find (memchr)
+    over the mapped pages, and the body is sliced straight out of the mapping.
+    Runs on a reader thread; file reads release the GIL.
+    """
+    with open(filepath, 'rb') as infile:
+        if os.fstat(infile.fileno()).st_size == 0:
+            return b'', b'' # mmap refuses empty files
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            newline_index = mapped.find(b'\n')
+            if newline_index == -1:
+                return mapped[:], b''
+            return mapped[:newline_index + 1], mapped[newline_index + 1:]
 
 def create_master_depth_chart_csv(input_directory="combined_depth_charts", output_filename="master_nfl_depth_chart.csv"):
     """
@@ -15,42 +40,64 @@ def create_master_depth_chart_csv(input_directory="combined_depth_charts", outpu
     print(f"Combining CSVs from: {input_directory}")
     print(f"Outputting master CSV to: {output_filepath}")
 
-    all_files = [f for f in os.listdir(input_directory) if f.endswith(".csv") and f != output_filename]
+    # Sort files to ensure consistent order, though not strictly necessary for combination.
+    # DirEntry already carries the full path and file type, so no extra join/stat per file.
+    with os.scandir(input_directory) as entries:
+        all_files = sorted(
+            entry.path for entry in entries
+            if entry.name.endswith(".csv") and entry.name != output_filename and entry.is_file()
+        )
     
     if not all_files:
         print("No combined team CSV files found to combine. Make sure you've run the 'combine_team_depth_charts' script first.")
         return
 
-    # Sort files to ensure consistent order, though not strictly necessary for combination
-    all_files.sort()
-
     header_written = False
-    rows_written_count = 0
+    lines_written_count = 0
 
     try:
-        with open(output_filepath, 'w', encoding='utf-8', newline='') as outfile:
-            writer = csv.writer(outfile)
-
-            for i, filename in enumerate(all_files):
-                filepath = os.path.join(input_directory, filename)
-                print(f"  Processing: {filename}")
-
-                with open(filepath, 'r', encoding='utf-8', newline='') as infile:
-                    reader = csv.reader(infile)
-                    
-                    header = next(reader) # Read header
-                    
-                    if not header_written:
-                        writer.writerow(header) # Write header only once
-                        header_written = True
-
-                    for row in reader:
-                        writer.writerow(row)
-                        rows_written_count += 1
+        # Every team CSV comes from the same writer with the same schema, so the bodies
+        # are copied byte for byte instead of being decoded into rows and re-encoded.
+        # Reader threads fetch the next files while this thread writes the current one.
+        with ThreadPoolExecutor(max_workers=READER_WORKERS) as pool, \
+             open(output_filepath, 'wb', buffering=IO_BUFFER_SIZE) as outfile:
+            remaining_files = iter(all_files)
+            pending_reads = deque(
+                (filepath, pool.submit(_read_team_csv, filepath))
+                for filepath in islice(remaining_files, READER_WORKERS)
+            )
+
+            while pending_reads:
+                filepath, read_future = pending_reads.popleft()
+                next_filepath = next(remaining_files, None)
+                if next_filepath is not None:
+                    pending_reads.append((next_filepath, pool.submit(_read_team_csv, next_filepath)))
+
+                print(f"  Processing: {os.path.basename(filepath)}")
+                header, body = read_future.result()
+                if not header:
+                    print(f"  Skipping empty file: {os.path.basename(filepath)}")
+                    continue
+
+                # The bodies are concatenated, so every file's last line must be terminated or it
+                # would run into the next team's first row. Use the file's own line ending.
+                line_end = b'\r\n' if header.endswith(b'\r\n') else b'\n'
+                if not header.endswith(b'\n'):
+                    header += line_end
+                if body and not body.endswith(b'\n'):
+                    body += line_end
+
+                if not header_written:
+                    outfile.write(header) # Write header only once
+                    header_written = True
+
+                outfile.write(body)
+                # Counted as physical lines: a quoted field with an embedded newline spans two
+                lines_written_count += body.count(b'\n')
         
         print("\n--- Master CSV Creation Summary ---")
         print(f"Successfully created master CSV: {output_filepath}")
-        print(f"Total rows written (excluding header): {rows_written_count}")
+        print(f"Total lines written (excluding header): {lines_written_count}")
         print("Combination process complete.")
 
     except Exception as e:
@@ -0,0 +1,101 @@
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import clearTempFiles
+import master_combine
+import process_defenses
+import process_offenses
+import process_special
+import rename_files
+import start_combining
+
+# Renamed table file suffix -> (processor for that unit, unit key used by start_combining)
+UNIT_PROCESSORS = {
+    "_depth_chart_offense.html": (process_offenses.process_depth_chart_file, "_offense.csv"),
+    "_depth_chart_defense.html": (process_defenses.process_depth_chart_file, "_defense.csv"),
+    "_depth_chart_special_teams.html": (process_special.process_depth_chart_file, "_special_teams.csv"),
+}
+
+def run_pipeline(input_directory="team_tables", csv_output_directory="team_CSV",
+                 combined_directory="combined_depth_charts", clean=False):
+    """
+    Runs rename -> process (offense, defense, special teams) -> combine -> master combine
+    on one shared process pool, instead of running each script separately.
+    A team's combine step is submitted as soon as all of its unit CSVs are written,
+    so combining overlaps with parsing the remaining teams.
+    With clean=True the intermediate HTML/XML/CSV files are deleted at the very end
+    (after the master CSV is built, since they are the inputs of the earlier steps).
+    """
+    if not os.path.isdir(input_directory):
+        print(f"Error: Directory '{input_directory}' not found.")
+        return
+
+    # Renaming is a handful of os.replace calls, cheaper inline than as pool tasks
+    rename_files.rename_depth_chart_files(input_directory)
+
+    os.makedirs(csv_output_directory, exist_ok=True)
+    os.makedirs(combined_directory, exist_ok=True)
+
+    processed_count = 0
+    skipped_count = 0
+    teams_combined_count = 0
+    units_pending = defaultdict(int) # team_slug -> unit files still being parsed
+    team_files = defaultdict(dict) # team_slug -> {unit key: CSV path}, as start_combining expects
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        parse_futures = {}
+        with os.scandir(input_directory) as entries:
+            for entry in entries:
+                for suffix, (process_file, unit_key) in UNIT_PROCESSORS.items():
+                    if entry.name.endswith(suffix):
+                        team_slug = entry.name[:-len(suffix)]
+                        units_pending[team_slug] += 1
+                        future = pool.submit(process_file, entry.name, input_directory, csv_output_directory)
+                        parse_futures[future] = (entry.name, team_slug, unit_key)
+                        break
+
+        combine_futures = {} # future -> team_slug
+        for future in as_completed(parse_futures):
+            filename, team_slug, unit_key = parse_futures[future]
+            try:
+                _, status = future.result()
+            except Exception as e:
+                # A crashed parse counts as skipped; the team still combines its other units
+                print(f"An error occurred while processing '{filename}': {e}. Skipping.")
+                status = 'failed'
+            if status == 'processed':
+                processed_count += 1
+                team_files[team_slug][unit_key] = os.path.join(csv_output_directory, filename.replace('.html', '.csv'))
+            else:
+                skipped_count += 1
+
+            units_pending[team_slug] -= 1
+            if units_pending[team_slug] == 0 and team_files[team_slug]:
+                combine_future = pool.submit(start_combining.process_team, team_slug,
+                                             team_files[team_slug], combined_directory)
+                combine_futures[combine_future] = team_slug
+
+        for future in as_completed(combine_futures):
+            try:
+                combined = future.result()
+            except Exception as e:
+                print(f"An error occurred while combining team '{combine_futures[future]}': {e}. Skipping.")
+                continue
+            if combined:
+                teams_combined_count += 1
+
+    print("\n--- Pipeline Summary ---")
+    print(f"Unit files processed: {processed_count}")
+    print(f"Unit files skipped: {skipped_count}")
+    print(f"Teams combined: {teams_combined_count}")
+
+    master_combine.create_master_depth_chart_csv(combined_directory)
+
+    if clean:
+        clearTempFiles.delete_temp_files([csv_output_directory, input_directory])
+
+
+if __name__ == "__main__":
+    run_pipeline(clean="--clean" in sys.argv[1:])
@@ -1,169 +1,267 @@
 import os
-import csv
-from bs4 import BeautifulSoup
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from lxml import html, etree
+from xml.sax.saxutils import escape
 
-def prettify_xml(elem):
-    """Return a pretty-printed XML string for the Element."""
-    rough_string = tostring(elem, 'utf-8')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ", encoding="utf-8").decode("utf-8")
+# One depth chart slot's player. A tuple is far smaller than a dict per player and
+# attribute access is an index into it rather than a hash lookup.
+Player = namedtuple('Player', 'name url uid status')
 
-def parse_depth_chart_html(html_content):
+def _has_class(class_name):
+    """Returns an XPath predicate matching elements that carry the given CSS class token."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# The extraction only reads element text, so whitespace-only text nodes between tags (the
+# line breaks and indentation ESPN's markup carries into the saved tables) and comments are
+# dropped at parse time, keeping the tree down to the nodes that are actually read
+_HTML_PARSER = html.HTMLParser(remove_blank_text=True, remove_comments=True)
+
+# Compiled once at import so every file does its node selection inside libxml2
+_TITLE_XPATH = etree.XPath(f"(//div[{_has_class('Table__Title')}])[1]")
+# First statCell span of every position row: one query instead of a row query plus one per row
+_POSITION_SPANS_XPATH = etree.XPath(
+    f"(//table[{_has_class('Table--fixed-left')}])[1]/descendant::tbody[1]//tr[{_has_class('Table__TR')}]"
+    "/descendant::span[@data-testid='statCell'][1]")
+_SCROLLER_XPATH = etree.XPath(f"(//div[{_has_class('Table__Scroller')}])[1]")
+_PLAYER_ROWS_XPATH = etree.XPath(f"descendant::table[1]/descendant::tbody[1]//tr[{_has_class('Table__TR')}]")
+_CELL_XPATH = etree.XPath(f".//td[{_has_class('Table__TD')}]")
+_LINK_XPATH = etree.XPath(f"(.//a[{_has_class('AnchorLink')}])[1]")
+_STATUS_XPATH = etree.XPath(f"(.//span[{_has_class('nfl-injuries-status')}])[1]")
+
+CSV_HEADER = ['TeamName', 'Position', 'Depth', 'PlayerName', 'PlayerURL', 'PlayerUID', 'InjuryStatus']
+# csv.writer's default dialect ends rows with \r\n
+_CSV_HEADER_LINE = ','.join(CSV_HEADER) + '\r\n'
+
+# Attribute escapes applied on top of &, < and >, matching ElementTree's serializer
+_XML_ATTR_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#09;'}
+
+def load_depth_chart(html_content):
     """
     Parses the raw HTML content of a single ESPN NFL depth chart table
-    and extracts structured data including formation, positions, and players.
+    and locates the formation title, the positions, and the player row for each position.
     This function is generalized and works for offense, defense, and special teams HTML structures.
+    Returns (formation_title, position_rows), where position_rows pairs every position
+    name with its <tr> of depth slots, or None if either table is missing.
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    tree = html.fromstring(html_content, parser=_HTML_PARSER)
 
     # Extract the formation title
-    title_div = soup.find('div', class_='Table__Title')
-    formation_title = title_div.text.strip() if title_div else "Unknown Formation"
+    title_divs = _TITLE_XPATH(tree)
+    formation_title = title_divs[0].text_content().strip() if title_divs else "Unknown Formation"
     print(f"Parsing formation: {formation_title}")
 
     # Extract positions from the fixed-left table
     positions = []
-    left_table = soup.find('table', class_='Table--fixed-left')
-    if left_table:
-        for row in left_table.find('tbody').find_all('tr', class_='Table__TR'):
-            position_span = row.find('span', {'data-testid': 'statCell'})
-            if position_span:
-                # Extract only the position abbreviation (e.g., "PK", "P", "LS")
-                positions.append(position_span.text.split()[0].strip())
+    for position_span in _POSITION_SPANS_XPATH(tree):
+        # Extract only the position abbreviation (e.g., "PK", "P", "LS")
+        positions.append(position_span.text_content().split()[0].strip())
     
     if not positions:
         print("Warning: No positions found in the fixed-left table.")
         return None
 
-    # Extract player data from the scrollable table
-    player_data_rows = []
-    right_table_scroller = soup.find('div', class_='Table__Scroller')
-    if right_table_scroller:
-        right_table = right_table_scroller.find('table')
-        if right_table:
-            for row in right_table.find('tbody').find_all('tr', class_='Table__TR'):
-                players_in_row = []
-                for cell in row.find_all('td', class_='Table__TD'):
-                    player_link = cell.find('a', class_='AnchorLink')
-                    if player_link:
-                        player_name = player_link.text.strip()
-                        player_url = player_link['href']
-                        player_uid = player_link.get('data-player-uid') # Use .get() for safer access
-                        
-                        injury_status_span = cell.find('span', class_='nfl-injuries-status')
-                        injury_status = injury_status_span.text.strip() if injury_status_span and injury_status_span.text.strip() else None
-                        
-                        players_in_row.append({
-                            'name': player_name,
-                            'url': player_url,
-                            'uid': player_uid,
-                            'status': injury_status
-                        })
-                    else:
-                        # Handle cases where there's no player (e.g., empty depth slot represented by '-')
-                        if cell.find('span', {'data-testid': 'statCell'}) and cell.find('span', {'data-testid': 'statCell'}).text.strip() == '-':
-                            players_in_row.append(None)
-                        else:
-                            players_in_row.append(None) # Or an empty dictionary if you prefer to distinguish empty from '-'
-                player_data_rows.append(players_in_row)
-    else:
+    # Player data lives in the scrollable table, one row per position
+    right_table_scroller = _SCROLLER_XPATH(tree)
+    if not right_table_scroller:
         print("Warning: No scroller table found for player data.")
         return None
 
-    # Combine positions with player data, ensuring proper alignment
-    # The number of rows in positions and player_data_rows should match
-    structured_data = {
-        'formation': formation_title,
-        'positions_and_players': []
-    }
+    # The number of rows in positions and the player table should match; zip keeps them aligned
+    return formation_title, list(zip(positions, _PLAYER_ROWS_XPATH(right_table_scroller[0])))
 
-    num_rows = min(len(positions), len(player_data_rows))
-    for i in range(num_rows):
-        position_name = positions[i]
-        depth_players = player_data_rows[i]
-        
-        structured_data['positions_and_players'].append({
-            'position': position_name,
-            'players': depth_players
-        })
-    
-    return structured_data
+def _extract_player(cell):
+    """Returns the player in a depth slot cell, or None for an empty slot (ESPN renders these as '-')."""
+    player_link = _LINK_XPATH(cell)
+    if not player_link:
+        return None
+
+    player_link = player_link[0]
+    injury_status_span = _STATUS_XPATH(cell)
+    injury_status = injury_status_span[0].text_content().strip() if injury_status_span else None
+    return Player(
+        player_link.text_content().strip(),
+        player_link.attrib['href'],
+        player_link.get('data-player-uid'), # Use .get() for safer access
+        injury_status or None
+    )
 
-def convert_to_xml(parsed_data):
+def iter_row_slots(row):
     """
-    Converts the structured depth chart data into an XML Element.
+    Yields a (depth, player) tuple for every depth slot cell in one position row, straight
+    from the DOM. player is a Player, or None for an empty slot; depth starts at 1.
     """
-    if not parsed_data:
+    for depth, cell in enumerate(_CELL_XPATH(row), 1):
+        yield depth, _extract_player(cell)
+
+def iter_depth_entries(position_rows):
+    """
+    Yields a (position, depth, player) tuple for every depth slot, so the CSV writers can
+    stream the chart without an intermediate structure. A position whose row has no depth
+    slots yields nothing; the XML writers walk position_rows themselves so it still gets
+    its (empty) <Position> element.
+    """
+    for position_name, row in position_rows:
+        for depth, player in iter_row_slots(row):
+            yield position_name, depth, player
+
+def _player_dict(player):
+    """Converts a Player back to the dict shape parse_depth_chart_html has always returned."""
+    return player._asdict() if player else None
+
+def parse_depth_chart_html(html_content):
+    """
+    Parses the raw HTML content of a single ESPN NFL depth chart table
+    and extracts structured data including formation, positions, and players.
+    Thin wrapper over load_depth_chart for callers that want the whole chart as a dict
+    (players keep their original dict form).
+    """
+    depth_chart = load_depth_chart(html_content)
+    if depth_chart is None:
         return None
 
-    root = Element('DepthChartFormation', name=parsed_data['formation'])
+    formation_title, position_rows = depth_chart
+    return {
+        'formation': formation_title,
+        'positions_and_players': [
+            {'position': position_name, 'players': [_player_dict(_extract_player(cell)) for cell in _CELL_XPATH(row)]}
+            for position_name, row in position_rows
+        ]
+    }
+
+def _xml_player_field(tag, text):
+    """Renders one indented child element of <Player>, self-closing when empty like ElementTree does."""
+    if not text:
+        return f'\n      <{tag} />'
+    return f'\n      <{tag}>{escape(text)}</{tag}>'
+
+def render_xml(formation_title, position_rows):
+    """
+    Renders the (position, row) pairs from load_depth_chart straight to a pretty-printed
+    XML document string, laid out the way ElementTree.indent + write would lay it out.
+    Every Player record has the same fixed shape, so the markup is assembled from string
+    fragments instead of allocating an Element per field and indenting the tree afterwards.
+    """
+    parts = ["<?xml version='1.0' encoding='utf-8'?>\n<DepthChartFormation name=\"",
+             escape(formation_title, _XML_ATTR_ENTITIES), '"']
+    if not position_rows:
+        parts.append(' />')
+        return ''.join(parts)
 
-    for pos_entry in parsed_data['positions_and_players']:
-        position_elem = SubElement(root, 'Position', name=pos_entry['position'])
-        for depth, player in enumerate(pos_entry['players'], 1):
+    parts.append('>')
+    for position_name, row in position_rows:
+        parts.append(f'\n  <Position name="{escape(position_name, _XML_ATTR_ENTITIES)}"')
+        position_empty = True
+        for depth, player in iter_row_slots(row):
+            if position_empty:
+                parts.append('>')
+                position_empty = False
             if player:
-                player_elem = SubElement(position_elem, 'Player')
-                SubElement(player_elem, 'Depth').text = str(depth)
-                SubElement(player_elem, 'Name').text = player['name']
-                SubElement(player_elem, 'URL').text = player['url']
-                if player['uid']:
-                    SubElement(player_elem, 'UID').text = player['uid']
-                if player['status']:
-                    SubElement(player_elem, 'Status').text = player['status']
+                parts.append('\n    <Player>')
+                parts.append(f'\n      <Depth>{depth}</Depth>')
+                parts.append(_xml_player_field('Name', player.name))
+                parts.append(_xml_player_field('URL', player.url))
+                if player.uid:
+                    parts.append(_xml_player_field('UID', player.uid))
+                if player.status:
+                    parts.append(_xml_player_field('Status', player.status))
+                parts.append('\n    </Player>')
             else:
                 # Add an empty slot if no player at this depth
-                empty_slot = SubElement(position_elem, 'Player')
-                empty_slot.set('depth', str(depth))
-                empty_slot.set('status', 'Empty Slot')
-                
-    return root
+                parts.append(f'\n    <Player depth="{depth}" status="Empty Slot" />')
+        # A position with no depth slots self-closes, as ElementTree writes an empty element
+        parts.append(' />' if position_empty else '\n  </Position>')
+
+    parts.append('\n</DepthChartFormation>')
+    return ''.join(parts)
+
+def _q(field):
+    """Quotes a CSV field only when it needs it, the same way csv.writer's QUOTE_MINIMAL does."""
+    if ',' in field or '"' in field or '\n' in field or '\r' in field:
+        return '"' + field.replace('"', '""') + '"'
+    return field
 
-def convert_to_csv(parsed_data, team_name):
+def convert_to_csv(depth_entries, team_name, out_fh):
     """
-    Converts the structured depth chart data into a CSV string.
+    Writes a stream of (position, depth, player) depth chart entries as CSV to the open
+    text file handle out_fh.
     Each row represents a player with their position, depth, name, URL, UID, and status.
     Includes the 'TeamName' column.
+    Rows go straight to the file instead of being assembled in an in-memory string first.
+    The schema is fixed, so each row is formatted directly: depth is an int and never needs
+    quoting, the team name is checked once per file, and only the text fields go through _q.
+    Returns the number of rows written, excluding the header.
     """
-    if not parsed_data:
-        return None
+    out_fh.write(_CSV_HEADER_LINE)
+    team_field = _q(team_name)
 
-    csv_rows = []
-    # CSV Header
-    csv_rows.append(['TeamName', 'Position', 'Depth', 'PlayerName', 'PlayerURL', 'PlayerUID', 'InjuryStatus'])
+    rows_written = 0
+    for position_name, depth, player in depth_entries:
+        if player:
+            out_fh.write(f'{team_field},{_q(position_name)},{depth},{_q(player.name)},{_q(player.url)},'
+                         f'{_q(player.uid or "")},{_q(player.status or "")}\r\n')
+        else:
+            # Include empty slots in CSV for completeness
+            out_fh.write(f'{team_field},{_q(position_name)},{depth},,,,Empty Slot\r\n')
+        rows_written += 1
+    return rows_written
 
-    for pos_entry in parsed_data['positions_and_players']:
-        position_name = pos_entry['position']
-        for depth, player in enumerate(pos_entry['players'], 1):
-            if player:
-                csv_rows.append([
-                    team_name,
-                    position_name,
-                    str(depth),
-                    player['name'],
-                    player['url'],
-                    player['uid'] if player['uid'] else '',
-                    player['status'] if player['status'] else ''
-                ])
-            else:
-                # Include empty slots in CSV for completeness
-                csv_rows.append([
-                    team_name,
-                    position_name,
-                    str(depth),
-                    '', # No player name
-                    '', # No player URL
-                    '', # No player UID
-                    'Empty Slot' # Indicate it's an empty slot
-                ])
-    
-    # Use io.StringIO to write to a string buffer
-    import io
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerows(csv_rows)
-    return output.getvalue()
+
+def process_depth_chart_file(filename, input_directory, csv_output_directory):
+    """
+    Parses a single special teams depth chart HTML file and writes its XML (next to the
+    source file, for quality checks) and CSV (into csv_output_directory).
+    Runs inside a worker process, so it opens its own files and shares no state.
+    Returns a (filename, status) tuple where status is 'processed', 'skipped' or 'failed'.
+    """
+    input_filepath = os.path.join(input_directory, filename)
+
+    # Extract team name from filename
+    team_slug = filename.replace("_depth_chart_special_teams.html", "")
+    team_name = team_slug.replace("-", " ").title()
+
+    html_content = None
+    try:
+        with open(input_filepath, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        print(f"\n--- Processing {filename} ({team_name}) ---")
+    except FileNotFoundError:
+        print(f"Error: The file '{input_filepath}' was not found. Skipping.")
+        return filename, 'skipped'
+    except Exception as e:
+        print(f"An error occurred while reading '{input_filepath}': {e}. Skipping.")
+        return filename, 'skipped'
+
+    if not html_content:
+        print(f"No HTML content to process in {filename}. Skipping.")
+        return filename, 'skipped'
+
+    # 1. Parse the HTML content
+    depth_chart = load_depth_chart(html_content)
+    if depth_chart is None:
+        print(f"Failed to parse HTML content for {filename}.")
+        return filename, 'failed'
+    formation_title, position_rows = depth_chart
+
+    # 2. Convert to XML (still outputs to team_tables for quality check)
+    output_xml_filename = filename.replace('.html', '.xml')
+    output_xml_filepath = os.path.join(input_directory, output_xml_filename)
+    xml_output = render_xml(formation_title, position_rows)
+    # Optionally print XML to console
+    # print("\n--- XML Output ---")
+    # print(xml_output)
+    with open(output_xml_filepath, "w", encoding="utf-8") as f:
+        f.write(xml_output)
+    print(f"XML saved to {output_xml_filepath}")
+
+    # 3. Convert to CSV (now outputs to team_CSV), streaming rows straight from the DOM
+    output_csv_filename = filename.replace('.html', '.csv')
+    output_csv_filepath = os.path.join(csv_output_directory, output_csv_filename)
+    with open(output_csv_filepath, "w", encoding="utf-8", newline='', buffering=1 << 20) as f:
+        convert_to_csv(iter_depth_entries(position_rows), team_name, f)
+    print(f"CSV saved to {output_csv_filepath}")
+    return filename, 'processed'
 
 
 if __name__ == "__main__":
@@ -179,74 +277,22 @@ if __name__ == "__main__":
     processed_count = 0
     skipped_count = 0
 
-    for filename in os.listdir(input_directory):
-        # Process only special teams files
-        if filename.endswith("_depth_chart_special_teams.html"):
-            
-            input_filepath = os.path.join(input_directory, filename)
-            
-            # Extract team name from filename
-            team_slug = filename.replace("_depth_chart_special_teams.html", "")
-            team_name = team_slug.replace("-", " ").title()
-
-            html_content = None
-            try:
-                with open(input_filepath, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                print(f"\n--- Processing {filename} ({team_name}) ---")
-            except FileNotFoundError:
-                print(f"Error: The file '{input_filepath}' was not found. Skipping.")
-                skipped_count += 1
-                continue
-            except Exception as e:
-                print(f"An error occurred while reading '{input_filepath}': {e}. Skipping.")
-                skipped_count += 1
-                continue
-
-            if html_content:
-                # 1. Parse the HTML content
-                parsed_data = parse_depth_chart_html(html_content)
-
-                if parsed_data:
-                    # 2. Convert to XML (still outputs to team_tables for quality check)
-                    xml_root = convert_to_xml(parsed_data)
-                    if xml_root is not None:
-                        xml_output = prettify_xml(xml_root)
-                        # Optionally print XML to console
-                        # print("\n--- XML Output ---")
-                        # print(xml_output)
-                        
-                        output_xml_filename = filename.replace('.html', '.xml')
-                        output_xml_filepath = os.path.join(input_directory, output_xml_filename)
-                        with open(output_xml_filepath, "w", encoding="utf-8") as f:
-                            f.write(xml_output)
-                        print(f"XML saved to {output_xml_filepath}")
-                    else:
-                        print(f"Failed to convert XML for {filename}.")
-
-                    # 3. Convert to CSV (now outputs to team_CSV)
-                    csv_output = convert_to_csv(parsed_data, team_name) 
-                    if csv_output is not None:
-                        # Optionally print CSV to console
-                        # print("\n--- CSV Output ---")
-                        # print(csv_output)
-                        
-                        output_csv_filename = filename.replace('.html', '.csv')
-                        output_csv_filepath = os.path.join(csv_output_directory, output_csv_filename)
-                        with open(output_csv_filepath, "w", encoding="utf-8", newline='') as f:
-                            f.write(csv_output)
-                        print(f"CSV saved to {output_csv_filepath}")
-                        processed_count += 1
-                    else:
-                        print(f"Failed to convert CSV for {filename}.")
-                else:
-                    print(f"Failed to parse HTML content for {filename}.")
-            else:
-                print(f"No HTML content to process in {filename}. Skipping.")
-                skipped_count += 1
-        else:
-            # Skip files that don't match the special teams pattern
-            pass 
+    # Filter the directory listing down to special teams files in a single scandir pass
+    with os.scandir(input_directory) as entries:
+        special_teams_files = [entry.name for entry in entries if entry.name.endswith("_depth_chart_special_teams.html")]
+
+    # Every file is independent and parsing is CPU-bound pure Python (the GIL
+    # would serialize threads), so fan the files out across worker processes.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(process_depth_chart_file, special_teams_files,
+                                    repeat(input_directory), repeat(csv_output_directory),
+                                    chunksize=4))
+
+    for filename, status in results:
+        if status == 'processed':
+            processed_count += 1
+        elif status == 'skipped':
+            skipped_count += 1
 
     print("\n--- Processing Summary ---")
     print(f"Special Teams files processed: {processed_count}")
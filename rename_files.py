@@ -1,5 +1,30 @@
 import os
 
+# All scraped tables share this infix; the table number right after it picks the unit
+TABLE_INFIX = "_depth_chart_table_"
+TABLE_INFIX_LEN = len(TABLE_INFIX)
+# Table number -> unit name used in the renamed file
+SUFFIX_MAP = {'1': 'offense', '2': 'defense', '3': 'special_teams'}
+
+def _renamed_filename(filename):
+    """
+    Returns the unit-specific name for a scraped table file
+    (e.g. 'x_depth_chart_table_2.html' -> 'x_depth_chart_defense.html'),
+    or None if the file doesn't follow the table naming pattern.
+    One rfind and a dict lookup instead of trying every suffix in turn.
+    """
+    if not filename.endswith('.html'):
+        return None
+    infix_index = filename.rfind(TABLE_INFIX)
+    if infix_index < 0:
+        return None
+    digit_index = infix_index + TABLE_INFIX_LEN
+    unit = SUFFIX_MAP.get(filename[digit_index:digit_index + 1])
+    # The table number must be the last thing before the extension (rules out e.g. table_12)
+    if unit is None or digit_index + 1 != len(filename) - len('.html'):
+        return None
+    return filename[:infix_index] + '_depth_chart_' + unit + '.html'
+
 def rename_depth_chart_files(directory="team_tables"):
     """
     Renames depth chart HTML files in the specified directory.
@@ -13,42 +38,31 @@ def rename_depth_chart_files(directory="team_tables"):
 
     print(f"Starting file renaming in directory: '{directory}'")
 
-    # Define the renaming patterns
-    rename_patterns = {
-        "_depth_chart_table_1.html": "_depth_chart_offense.html",
-        "_depth_chart_table_2.html": "_depth_chart_defense.html",
-        "_depth_chart_table_3.html": "_depth_chart_special_teams.html"
-    }
-
     files_renamed_count = 0
     files_skipped_count = 0
 
-    for filename in os.listdir(directory):
-        old_filepath = os.path.join(directory, filename)
-
-        # Ensure it's a file and not a directory
-        if os.path.isfile(old_filepath):
-            renamed = False
-            for old_suffix, new_suffix in rename_patterns.items():
-                if filename.endswith(old_suffix):
-                    # Construct the new filename by replacing the suffix
-                    new_filename = filename.replace(old_suffix, new_suffix)
-                    new_filepath = os.path.join(directory, new_filename)
-                    
-                    try:
-                        os.rename(old_filepath, new_filepath)
-                        print(f"Renamed: '{filename}' -> '{new_filename}'")
-                        files_renamed_count += 1
-                        renamed = True
-                        break # Move to the next file once a match is found and renamed
-                    except OSError as e:
-                        print(f"Error renaming '{filename}': {e}")
-                        renamed = True # Mark as processed, even if error, to avoid re-attempting
-                        break
-
-            if not renamed:
+    # Materialize the listing first so renaming doesn't mutate the directory mid-scan
+    with os.scandir(directory) as entries:
+        dir_entries = list(entries)
+
+    for entry in dir_entries:
+        filename = entry.name
+
+        # Ensure it's a file and not a directory (uses the type cached by scandir, no extra stat)
+        if entry.is_file(follow_symlinks=False):
+            new_filename = _renamed_filename(filename)
+            if new_filename is None:
                 print(f"Skipped: '{filename}' (no matching rename pattern)")
                 files_skipped_count += 1
+                continue
+
+            try:
+                # os.replace has the same cost as os.rename but overwrites an existing target on every platform
+                os.replace(entry.path, os.path.join(directory, new_filename))
+                print(f"Renamed: '{filename}' -> '{new_filename}'")
+                files_renamed_count += 1
+            except OSError as e:
+                print(f"Error renaming '{filename}': {e}")
         else:
             print(f"Skipped: '{filename}' (not a file)")
             files_skipped_count += 1
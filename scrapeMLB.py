@@ -1,35 +1,130 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from lxml import html, etree
 import os
 import json
-import re
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+try:
+    # Optional: keeps fetched pages on disk between runs (pip install requests-cache)
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    # Optional: also saves the league table as a compressed Parquet file (pip install pyarrow)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+def _has_class(class_name):
+    """Returns an XPath predicate matching elements that carry the given CSS class token."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# Team pages being downloaded at once; keeps the scrape polite to ESPN
+FETCH_CONCURRENCY = 10
+
+# How long a cached team page is served without asking ESPN again, in seconds
+CACHE_EXPIRE_AFTER = 3600
+
+# One session for every team page, so the keep-alive connections to espn.com are reused
+# instead of doing a fresh TCP + TLS handshake per request. The pool holds one connection
+# per concurrent fetch. With requests-cache installed, repeat runs within CACHE_EXPIRE_AFTER
+# are answered from espn_mlb_cache.sqlite and only the parsing is left to do.
+if requests_cache is not None:
+    SESSION = requests_cache.CachedSession('espn_mlb_cache', expire_after=CACHE_EXPIRE_AFTER)
+else:
+    SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': ACCEPT_ENCODING, # gzip/deflate, plus br/zstd when a decoder is installed
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_CONCURRENCY))
+
+# Depth labels that aren't an ordinal ("2nd") or a generic "Depth N" label
+# Lower number indicates higher priority (e.g., Starter is 1, 2nd is 2)
+_NAMED_DEPTH_RANKS = {
+    "Starter": 1,
+    "P": 1, "RP": 2, "CL": 3 # Specific pitcher depths if they appear as labels
+}
+_ORDINAL_SUFFIXES = ('st', 'nd', 'rd', 'th')
+# Default high rank for any unrecognized depth labels, making them lower priority
+DEFAULT_DEPTH_RANK = 999
+
+# Every record from parse_mlb_depth_chart_data has exactly these keys; this is the CSV column order
+CSV_HEADERS = (
+    "team_name", "team_abbrev", "player_name", "position_name",
+    "depth_label", "status", "player_url", "section_title"
+)
+
+# The target div identified by the user: <div class="ResponsiveTable ResponsiveTable--fixed-left">
+CONTAINER_CLASS = 'ResponsiveTable ResponsiveTable--fixed-left'
+_CONTAINER_MARKER = f'<div class="{CONTAINER_CLASS}"'
+# Characters handed to the pull parser at a time while looking for the end of the container
+_FEED_CHUNK_SIZE = 1 << 16
+
+# Compiled once at import so every team's depth chart is walked inside libxml2
+_CONTAINER_XPATH = etree.XPath(f"(//div[@class='{CONTAINER_CLASS}'])[1]")
+_TITLE_XPATH = etree.XPath(f"(.//div[{_has_class('Table__Title')}])[1]")
+# Only the first two tables are ever read, so only those get wrapped as Python elements
+_TABLES_XPATH = etree.XPath("(.//table)[position() <= 2]")
+_HEADER_SPANS_XPATH = etree.XPath("(.//thead)[1]//th/descendant::span[@data-testid='headerTable'][1]")
+_BODY_ROWS_XPATH = etree.XPath("(.//tbody)[1]//tr")
+_POSITION_SPAN_XPATH = etree.XPath("(.//span[@data-testid='statCell'])[1]")
+_CELL_XPATH = etree.XPath(".//td")
+_PLAYER_LINK_XPATH = etree.XPath(f"(.//a[{_has_class('AnchorLink')}])[1]")
+# Evaluates straight to the status span's text ('' when the cell has none), so no element is built for it
+_STATUS_TEXT_XPATH = etree.XPath("string((.//span[contains(@class, 'nfl-injuries-status')])[1])", smart_strings=False)
+
+def _parse_depth_chart_container(page_html):
+    """
+    Parses only the depth chart container out of a full team page and returns it as an
+    lxml element, or None if the page has no container.
+    Most of the page is nav, scripts, ads and footer, so instead of building a tree for
+    all of it (the SoupStrainer idea), the raw text is searched for the container's
+    opening tag and fed to a pull parser from there until the container closes.
+    """
+    start = page_html.find(_CONTAINER_MARKER)
+    if start == -1:
+        # The tag isn't written the way we expect (e.g. extra attributes first); fall back to the whole page
+        found = _CONTAINER_XPATH(html.fromstring(page_html))
+        return found[0] if found else None
+
+    parser = etree.HTMLPullParser(events=('end',), tag='div')
+    parser.set_element_class_lookup(html.HtmlElementClassLookup()) # text_content() and friends
+    for offset in range(start, len(page_html), _FEED_CHUNK_SIZE):
+        parser.feed(page_html[offset:offset + _FEED_CHUNK_SIZE])
+        for _, element in parser.read_events():
+            if element.get('class') == CONTAINER_CLASS:
+                return element # The rest of the page is never parsed
+
+    # The container was never closed (truncated page); take what the parser has
+    found = _CONTAINER_XPATH(parser.close())
+    return found[0] if found else None
 
 def get_depth_chart_container(url):
     """
-    Fetch the ESPN MLB team depth chart page and return the raw HTML of the
-    main depth chart container div, if found.
+    Fetch the ESPN MLB team depth chart page and return the main depth chart
+    container div as a parsed lxml element, if found.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     # print(f"Fetching data from {url}...") # Commented out to reduce console spam during full league scrape
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url)
         response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # The target div identified by the user: <div class="ResponsiveTable ResponsiveTable--fixed-left">
-        depth_chart_container = soup.find('div', class_='ResponsiveTable ResponsiveTable--fixed-left')
+        depth_chart_container = _parse_depth_chart_container(response.text)
         
-        if not depth_chart_container:
+        if depth_chart_container is None:
             print(f"No specific depth chart container (ResponsiveTable--fixed-left) found on {url}. Skipping.")
             return None
 
-        # Return the prettified HTML of this specific container
-        return depth_chart_container.prettify()
+        # Hand back the parsed node itself so the page is parsed only once,
+        # rather than serializing the container and re-parsing the string
+        return depth_chart_container
         
     except requests.exceptions.RequestException as e:
         print(f"Network or HTTP error for {url}: {e}")
@@ -38,30 +133,27 @@ def get_depth_chart_container(url):
         print(f"An unexpected error occurred for {url}: {e}")
         return None
 
-def parse_mlb_depth_chart_data(raw_html_container, team_name, team_abbrev):
+def iter_mlb_depth_chart_players(container_node, team_name, team_abbrev):
     """
-    Parses the raw HTML of the main depth chart container into a flat list of player dictionaries.
+    Parses the main depth chart container element, yielding one player dictionary at a time.
     Each player dictionary will include team information.
     This function is specifically adapted for the ESPN MLB depth chart structure
     with two nested tables.
     """
-    parsed_players = []
-
-    if not raw_html_container:
-        return parsed_players
-
-    soup = BeautifulSoup(raw_html_container, 'html.parser')
+    # lxml elements are falsy when childless, so test against None explicitly
+    if container_node is None:
+        return
     
     # The provided HTML snippet shows a "Depth Chart" title within the main div
-    table_title_tag = soup.find('div', class_='Table__Title')
-    section_title = table_title_tag.text.strip() if table_title_tag else "MLB Depth Chart"
+    table_title_tag = _TITLE_XPATH(container_node)
+    section_title = table_title_tag[0].text_content().strip() if table_title_tag else "MLB Depth Chart"
 
     # Find the two internal tables within the main container
-    tables = soup.find_all('table')
+    tables = _TABLES_XPATH(container_node)
 
     if len(tables) < 2:
         # print(f"Warning: Expected at least two tables inside depth chart container for {team_name}, but found {len(tables)}. Skipping.")
-        return parsed_players
+        return
 
     # First table contains position names (fixed-left column)
     position_table = tables[0]
@@ -69,16 +161,12 @@ def parse_mlb_depth_chart_data(raw_html_container, team_name, team_abbrev):
     player_data_table = tables[1]
 
     # --- Extract depth levels from the header of the player_data_table ---
+    # The actual header text is inside a span with data-testid="headerTable" in each <th>
     depth_levels = []
-    header_row = player_data_table.find('thead')
-    if header_row:
-        # Find all <th> elements in the header row
-        th_elements = header_row.find_all('th')
-        for th in th_elements:
-            # The actual header text is inside a span with data-testid="headerTable"
-            header_span = th.find('span', {'data-testid': 'headerTable'})
-            if header_span and header_span.text.strip():
-                depth_levels.append(header_span.text.strip())
+    for header_span in _HEADER_SPANS_XPATH(player_data_table):
+        header_text = header_span.text_content().strip()
+        if header_text:
+            depth_levels.append(header_text)
     
     if not depth_levels:
         # print(f"Warning: Could not find depth level headers for {team_name}. Falling back to generic labels.")
@@ -86,104 +174,127 @@ def parse_mlb_depth_chart_data(raw_html_container, team_name, team_abbrev):
         depth_levels = [f"Depth {i+1}" for i in range(5)] # Assume up to 5 depth levels if headers are missing
 
 
-    # --- Extract position names from the first table's tbody ---
-    position_tbody = position_table.find('tbody')
-    # --- Extract player data from the second table's tbody ---
-    player_tbody = player_data_table.find('tbody')
+    # Fields shared by every player on this team, built once and copied into each record
+    team_fields = {
+        "team_name": team_name,
+        "team_abbrev": team_abbrev,
+        "section_title": section_title, # This will always be "MLB Depth Chart" in the current structure
+    }
 
-    if not position_tbody or not player_tbody:
-        # print(f"Error: Could not find tbody in one or both depth chart tables for {team_name}. Skipping.")
-        return parsed_players
+    # --- Extract position rows from the first table's tbody ---
+    position_rows = _BODY_ROWS_XPATH(position_table)
+    # --- Extract player rows from the second table's tbody ---
+    player_rows = _BODY_ROWS_XPATH(player_data_table)
 
-    position_rows = position_tbody.find_all('tr')
-    player_rows = player_tbody.find_all('tr')
+    if not position_rows or not player_rows:
+        # print(f"Error: Could not find rows in one or both depth chart tables for {team_name}. Skipping.")
+        return
 
     # Iterate through rows, assuming position_rows and player_rows correspond 1:1
-    for i in range(min(len(position_rows), len(player_rows))):
-        position_row = position_rows[i]
-        player_row = player_rows[i]
-
+    for position_row, player_row in zip(position_rows, player_rows):
         # Get position name from the first table's row
         # The position text is inside a span with data-testid="statCell"
-        position_name_tag = position_row.find('span', {'data-testid': 'statCell'})
-        position_name = position_name_tag.text.strip() if position_name_tag else "Unknown Position"
-        
-        # Remove any extraneous status info like '<span class="nfl-injuries-status n8"></span>' if present
-        position_name = re.sub(r'\s*<span[^>]*class="nfl-injuries-status[^>]*>\s*</span>', '', position_name)
-        position_name = position_name.replace('<!-- -->', '').strip() # Clean up HTML comments if BeautifulSoup doesn't remove them fully
+        position_name_tag = _POSITION_SPAN_XPATH(position_row)
+        # text_content() only joins text nodes, so tags like the nfl-injuries-status span
+        # and '<!-- -->' comments never end up in the position name
+        position_name = position_name_tag[0].text_content().strip() if position_name_tag else "Unknown Position"
 
         # Get player data from the second table's row (all td elements)
-        player_cells = player_row.find_all('td')
-        for j, player_cell in enumerate(player_cells):
-            player_name_tag = player_cell.find('a', class_='AnchorLink') # Player name is in an AnchorLink
-            player_name = player_name_tag.text.strip() if player_name_tag else None
-            player_url = player_name_tag['href'] if player_name_tag and 'href' in player_name_tag.attrs else None
+        player_cells = _CELL_XPATH(player_row)
+        if len(player_cells) > len(depth_levels):
+            # More cells than headers: fall back to generic labels for the extra depths, once
+            # per row here instead of a bounds check on every cell
+            depth_levels.extend(f"Depth {k+1}" for k in range(len(depth_levels), len(player_cells)))
+
+        for depth_label, player_cell in zip(depth_levels, player_cells):
+            player_name_tag = _PLAYER_LINK_XPATH(player_cell) # Player name is in an AnchorLink
+            player_name = player_name_tag[0].text_content().strip() if player_name_tag else None
+
+            # The cell only contains '-' if no player is listed for that depth, in which case
+            # there is no AnchorLink; checking the name avoids walking the whole cell's text
+            if not player_name or player_name == '-':
+                continue
+
+            player_url = player_name_tag[0].get('href')
             
-            player_status = None
             # Status is often in a sibling span, or directly after the name in the text.
             # The HTML shows <span class="nfl-injuries-status n8">IL15</span>
-            status_span = player_cell.find('span', class_=lambda x: x and 'nfl-injuries-status' in x)
-            if status_span and status_span.text.strip():
-                player_status = status_span.text.strip()
-
-            # The cell might also contain '-' if no player is listed for that depth
-            cell_text_content = player_cell.get_text(separator=' ', strip=True)
-            if cell_text_content == '-' or not player_name:
-                player_name = None # Ensure player name is None if it's just a dash
-
-            if player_name:
-                # Use the extracted depth level, or fallback to generic
-                depth_label = depth_levels[j] if j < len(depth_levels) else f"Depth {j+1}"
-                
-                player_data = {
-                    "team_name": team_name,
-                    "team_abbrev": team_abbrev,
-                    "section_title": section_title, # This will always be "MLB Depth Chart" in the current structure
-                    "position_name": position_name,
-                    "player_name": player_name,
-                    "depth_label": depth_label,
-                    "player_url": player_url,
-                    "status": player_status
-                }
-                parsed_players.append(player_data)
-    
-    return parsed_players
+            player_status = _STATUS_TEXT_XPATH(player_cell).strip() or None
+
+            player_data = {
+                **team_fields,
+                "position_name": position_name,
+                "player_name": player_name,
+                "depth_label": depth_label,
+                "player_url": player_url,
+                "status": player_status
+            }
+            yield player_data
+
+def parse_mlb_depth_chart_data(container_node, team_name, team_abbrev):
+    """Parses the main depth chart container element into a flat list of player dictionaries."""
+    return list(iter_mlb_depth_chart_players(container_node, team_name, team_abbrev))
+
+def depth_rank(label):
+    """
+    Returns the numeric priority of a depth label for deduplication (lower is better).
+    Ordinals ('1st', '3rd') and the generic fallback labels ('Depth 3') are ranked by
+    their number, the few named labels come from _NAMED_DEPTH_RANKS, and anything else
+    gets DEFAULT_DEPTH_RANK.
+    """
+    if label[:6] == 'Depth ':
+        number = label[6:]
+    elif label[-2:] in _ORDINAL_SUFFIXES:
+        number = label[:-2]
+    else:
+        return _NAMED_DEPTH_RANKS.get(label, DEFAULT_DEPTH_RANK)
+    return int(number) if number.isdigit() else DEFAULT_DEPTH_RANK
 
 def write_players_to_csv(players_data, filename):
     """
-    Writes a list of player dictionaries to a CSV file.
-    Automatically determines headers from the keys of the first dictionary.
+    Writes a list of player dictionaries to a CSV file, in CSV_HEADERS column order.
     """
     if not players_data:
         print("No player data to write to CSV.")
         return
 
-    # Get all unique headers from all dictionaries to ensure all fields are included
-    all_headers = set()
-    for player in players_data:
-        all_headers.update(player.keys())
-    
-    # Define a preferred order for headers. Any new headers will be appended alphabetically.
-    preferred_headers_order = [
-        "team_name", "team_abbrev", "player_name", "position_name", 
-        "depth_label", "status", "player_url", "section_title"
-    ]
-    # Filter preferred headers to only include those actually present in data
-    headers = [h for h in preferred_headers_order if h in all_headers]
-    # Add any remaining headers that are not in preferred order, sorted alphabetically
-    headers.extend(sorted([h for h in all_headers if h not in preferred_headers_order]))
-
-
     print(f"Writing {len(players_data)} player records to {filename}...")
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
+        # A 1 MiB buffer turns the per-row writes into a handful of write() syscalls
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_HEADERS, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(players_data)
         print("CSV file successfully created.")
     except Exception as e:
         print(f"Error writing to CSV file {filename}: {e}")
 
+def write_players_to_parquet(players_data, filename):
+    """
+    Writes a list of player dictionaries to a Parquet file with one string column per
+    CSV_HEADERS field. The encoding runs in Arrow's native code, and repetitive columns
+    like team_name, position_name and depth_label are dictionary-encoded, so the file
+    ends up far smaller than the CSV. Requires pyarrow.
+    """
+    columns = {header: [player.get(header) for player in players_data] for header in CSV_HEADERS}
+    schema = pa.schema([(header, pa.string()) for header in CSV_HEADERS])
+
+    print(f"Writing {len(players_data)} player records to {filename}...")
+    try:
+        pq.write_table(pa.Table.from_pydict(columns, schema=schema), filename, compression='zstd')
+        print("Parquet file successfully created.")
+    except Exception as e:
+        print(f"Error writing to Parquet file {filename}: {e}")
+
+def fetch_team_container(team_name, info, base_url):
+    """
+    Downloads one team's depth chart page and returns its container element, or None.
+    Called from the fetch thread pool.
+    """
+    team_url = f"{base_url}{info['abbrev']}/{info['slug']}"
+    print(f"Processing depth chart for {team_name}...")
+    return get_depth_chart_container(team_url)
+
 # Main execution for all MLB teams
 if __name__ == "__main__":
     # Define the list of MLB teams with their abbreviations and slugs for URL construction
@@ -221,63 +332,54 @@ if __name__ == "__main__":
         "Washington Nationals": {"abbrev": "wsh", "slug": "washington-nacionals"} # Fixed typo in slug from previous version
     }
 
-    # Define a mapping for depth label to a numeric rank for prioritization
-    # Lower number indicates higher priority (e.g., Starter is 1, 2nd is 2)
-    depth_rank_map = {
-        "Starter": 1, "1st": 1, "2nd": 2, "3rd": 3, "4th": 4, "5th": 5, "6th": 6,
-        "Depth 1": 1, "Depth 2": 2, "Depth 3": 3, "Depth 4": 4, "Depth 5": 5, "Depth 6": 6,
-        "P": 1, "RP": 2, "CL": 3 # Specific pitcher depths if they appear as labels
-    }
-    # Default high rank for any unmapped depth labels, making them lower priority
-    DEFAULT_DEPTH_RANK = 999 
-
     output_directory = "mlb_team_data"
     os.makedirs(output_directory, exist_ok=True) # Create the directory if it doesn't exist
 
-    all_raw_players_data = []
-
     base_url = "https://www.espn.com/mlb/team/depth/_/name/"
 
-    for team_name, info in mlb_teams.items():
-        abbrev = info["abbrev"]
-        slug = info["slug"]
-        team_url = f"{base_url}{abbrev}/{slug}"
-
-        print(f"Processing depth chart for {team_name}...")
-        raw_html_container = get_depth_chart_container(team_url)
-        
-        if raw_html_container:
-            players_for_team = parse_mlb_depth_chart_data(raw_html_container, team_name, abbrev)
-            if players_for_team:
-                all_raw_players_data.extend(players_for_team)
-                print(f"Successfully parsed {len(players_for_team)} players for {team_name}.")
-            else:
-                print(f"No players parsed for {team_name}. Check the page structure.")
-        else:
-            print(f"Could not retrieve depth chart container for {team_name}. Skipping.")
-        print("-" * 50) # Separator for readability
-
     # --- Deduplication and Prioritization Logic ---
+    # Done in the same pass that parses each team: players stream out of the parser
+    # straight into the dedup dict, with no per-team or league-wide list in between.
     final_players_data = {} # Key: (player_name, team_name), Value: best player record
-
-    for player_data in all_raw_players_data:
-        player_key = (player_data['player_name'], player_data['team_name'])
-        
-        # Get the numeric rank for the current player's depth label
-        current_depth_rank = depth_rank_map.get(player_data['depth_label'], DEFAULT_DEPTH_RANK)
-
-        if player_key not in final_players_data:
-            # If player not seen before, add them
-            final_players_data[player_key] = (current_depth_rank, player_data)
-        else:
-            # If player seen before, compare depth ranks
-            stored_depth_rank, stored_player_data = final_players_data[player_key]
-            
-            if current_depth_rank < stored_depth_rank:
-                # If current player has a better (lower) depth rank, update
-                final_players_data[player_key] = (current_depth_rank, player_data)
-            # If current_depth_rank == stored_depth_rank, keep the one that was first found
-            # If current_depth_rank > stored_depth_rank, keep the stored one
+    # Bound method hoisted out of the per-player loop
+    get_stored_player = final_players_data.get
+
+    # All 30 pages are downloaded concurrently instead of one round trip after another.
+    # map() hands results back in team order, so the output doesn't depend on which
+    # download finishes first (the dedup keeps the first record on rank ties), and
+    # each team is parsed while the later teams are still downloading.
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+        team_containers = executor.map(fetch_team_container, mlb_teams.keys(), mlb_teams.values(), repeat(base_url))
+
+        for (team_name, info), container_node in zip(mlb_teams.items(), team_containers):
+            if container_node is None:
+                print(f"Could not retrieve depth chart container for {team_name}. Skipping.")
+                print("-" * 50) # Separator for readability
+                continue
+
+            players_parsed = 0
+            try:
+                for player_data in iter_mlb_depth_chart_players(container_node, team_name, info["abbrev"]):
+                    players_parsed += 1
+                    player_key = (player_data['player_name'], player_data['team_name'])
+                    
+                    # Get the numeric rank for the current player's depth label
+                    current_depth_rank = depth_rank(player_data['depth_label'])
+
+                    # One lookup per player: add them if not seen before, or replace the stored
+                    # record if this one has a better (lower) depth rank.
+                    # If current_depth_rank == stored rank, keep the one that was first found
+                    stored = get_stored_player(player_key)
+                    if stored is None or current_depth_rank < stored[0]:
+                        final_players_data[player_key] = (current_depth_rank, player_data)
+            except Exception as e:
+                print(f"An unexpected error occurred while parsing {team_name}: {e}")
+
+            if players_parsed:
+                print(f"Successfully parsed {players_parsed} players for {team_name}.")
+            else:
+                print(f"No players parsed for {team_name}. Check the page structure.")
+            print("-" * 50) # Separator for readability
 
     # Extract just the player data dictionaries from the final_players_data
     deduplicated_players = [data for rank, data in final_players_data.values()]
@@ -285,6 +387,9 @@ if __name__ == "__main__":
     if deduplicated_players:
         output_csv_file = os.path.join(output_directory, "mlb_depth_charts_full.csv")
         write_players_to_csv(deduplicated_players, output_csv_file)
+        if pq is not None:
+            # Columnar copy of the same table; the CSV stays the primary output
+            write_players_to_parquet(deduplicated_players, os.path.splitext(output_csv_file)[0] + ".parquet")
         print(f"\nAll MLB depth chart data collected, deduplicated, and saved to {output_csv_file}")
     else:
         print("\nNo MLB depth chart data was successfully collected for any team.")
@@ -0,0 +1,390 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from lxml import html, etree
+import os
+import csv
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from operator import itemgetter
+
+# Shared fetching, dedup and CSV writing for the ESPN roster scrapers (scrapeNBA.py, scrapeNHL.py).
+# Each sport module supplies a SportConfig with its teams, URL, CSV columns and table parser.
+
+def _has_class(class_name):
+    """Returns an XPath predicate matching elements that carry the given CSS class token."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# Team pages being downloaded at once; kept low so the scrape stays polite to ESPN
+FETCH_CONCURRENCY = 8
+# Seconds to wait on ESPN before giving up on a team page: (connecting, each read of the response).
+# A connect that takes longer than ~3s is almost always a dropped SYN, better retried than waited on.
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Requests per second handed out to the fetch threads, and how many may go out back to back
+REQUEST_RATE = 8
+REQUEST_BURST = 8
+
+class TokenBucket:
+    """
+    Adaptive token bucket shared by the fetch threads: acquire() blocks until a token is free.
+    Tokens refill at `rate` per second, up to `burst` of them. increase() speeds the rate up
+    a little after a success (up to the starting rate); decrease() halves it and empties the
+    bucket when ESPN throttles or fails, so the threads back off together instead of all
+    retrying at full speed, much like TCP congestion control.
+    """
+    def __init__(self, rate, burst, min_rate=0.5, increase_factor=1.1, decrease_factor=0.5):
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.increase_factor = increase_factor
+        self.decrease_factor = decrease_factor
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait) # Outside the lock, so other threads can refill and check too
+
+    def increase(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * self.increase_factor)
+
+    def decrease(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = 0
+
+RATE_LIMITER = TokenBucket(REQUEST_RATE, REQUEST_BURST)
+
+class _ThrottleAwareRetry(Retry):
+    """
+    Retry that also slows RATE_LIMITER down whenever a response is retried for its status (429/5xx),
+    and takes a RATE_LIMITER token before urllib3 reissues the request, so retries stay under the
+    same rate as first attempts.
+    """
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.status_forcelist and response.status in self.status_forcelist:
+            RATE_LIMITER.decrease()
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        RATE_LIMITER.acquire()
+
+# Transient failures (throttling, 5xx, dropped connections) are retried with exponential
+# backoff, 0.5s, 1s, 2s, ... plus up to 0.5s of random jitter so the concurrent fetches
+# don't all come back at once. A Retry-After header on a 429/503 is honored instead.
+RETRY_POLICY = _ThrottleAwareRetry(
+    total=5,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+)
+
+# One session for every team page of every sport, so the keep-alive connections to espn.com
+# are reused instead of doing a fresh TCP + TLS handshake per request. The pool holds one
+# connection per concurrent fetch, and retries a failed request under RETRY_POLICY.
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': ACCEPT_ENCODING, # Only encodings urllib3 can decode here
+})
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_CONCURRENCY, max_retries=RETRY_POLICY)
+SESSION.mount('https://', _ADAPTER)
+SESSION.mount('http://', _ADAPTER)
+
+# Compiled once at import, so the per-table and per-row lookups don't re-parse an XPath string each call.
+# _CONTAINERS_XPATH matches the same divs as find_all('div', class_='ResponsiveTable').
+_CONTAINERS_XPATH = etree.XPath(f"//div[{_has_class('ResponsiveTable')}]")
+_TITLE_XPATH = etree.XPath(f"(.//div[{_has_class('Table__Title')}])[1]")
+_PLAYER_LINK_XPATH = etree.XPath(f"(.//a[{_has_class('AnchorLink')}])[1]")
+# Text of the first injury-status span in a name cell ('' when there is none). Evaluated by
+# libxml2 as a string, so no element is built for the span and no Python callback runs per span.
+_STATUS_TEXT_XPATH = etree.XPath(
+    "string((.//span[contains(@class, 'injuries-status') or contains(@class, 'n8')])[1])", smart_strings=False)
+# Text of a table cell's first <div> ('' when it has none), like the status text above
+_DIV_TEXT_XPATH = etree.XPath("string((.//div)[1])", smart_strings=False)
+# Trailing parenthesized text in a name cell, e.g. 'John Doe (DTD)'; compiled once, used per row
+STATUS_RE = re.compile(r'\(([^)]+)\)$')
+# Class token that marks a roster container, checked the same way in the raw page bytes
+# and in the parsed divs (as a whole token, like _has_class('ResponsiveTable'))
+_CONTAINER_CLASS = 'ResponsiveTable'
+# An opening <div ...> tag in the raw page bytes (quoted attribute values may hold '>'),
+# and the class attribute inside one, in any of the quoting styles HTML allows
+_DIV_TAG_RE = re.compile(rb'<div\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>', re.IGNORECASE)
+# Openings and closings of the raw-text sections a tag found in the bytes may sit inside
+_RAW_TEXT_BOUNDARY_RE = re.compile(rb'<(/?)(?:script|style)\b|<!--|-->', re.IGNORECASE)
+_CLASS_ATTR_RE = re.compile(rb'[\s/]class\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+# Bytes handed to the pull parser at a time while looking for the end of the last container
+_FEED_CHUNK_SIZE = 1 << 16
+# ESPN serves its pages as UTF-8; libxml2 decodes the bytes itself, so requests never has to
+# decode (or guess the charset of) the whole page into a str first
+PAGE_ENCODING = 'utf-8'
+_PAGE_PARSER = html.HTMLParser(encoding=PAGE_ENCODING)
+
+@dataclass(frozen=True)
+class SportConfig:
+    """Everything run() needs to know about one sport's ESPN roster pages."""
+    name: str # Used in log messages, e.g. "NBA"
+    base_url: str # Team roster URL up to the team abbreviation
+    teams: dict # Team name -> {"abbrev": ..., "slug": ...}
+    # (table containers, team_name, team_abbrev) -> iterator of player dictionaries
+    iter_players: Callable
+    fieldnames: tuple # CSV column order; every player dictionary has exactly these keys
+    output_directory: str
+    output_filename: str
+
+def clear_session():
+    """
+    Closes the keep-alive connections held by SESSION. The session stays usable; the next
+    request simply opens a fresh connection.
+    """
+    SESSION.close()
+
+def _container_tag_offsets(page_bytes):
+    """
+    Returns the offsets of the roster containers' opening tags in the raw page bytes.
+    Tags inside scripts or comments are found too, so this can over-count but never misses
+    a container the parser would see; over-counting only means the page is parsed to the end.
+    """
+    offsets = []
+    container_class = _CONTAINER_CLASS.encode()
+    for tag in _DIV_TAG_RE.finditer(page_bytes):
+        if container_class not in tag[0]:
+            continue # Cheap substring test before looking for the class attribute
+        class_attr = _CLASS_ATTR_RE.search(tag[0])
+        if class_attr and container_class in (class_attr[1] or class_attr[2] or class_attr[3] or b'').split():
+            offsets.append(tag.start())
+    return offsets
+
+def _feed_start(page_bytes, offset):
+    """
+    Returns where to start feeding the pull parser so its first tag is the one at offset.
+    If that tag sits inside a script, style or comment (e.g. a marker in a JS string),
+    starting there would parse the rest of that section as markup, so start at the top.
+    """
+    last_boundary = None
+    for last_boundary in _RAW_TEXT_BOUNDARY_RE.finditer(page_bytes, 0, offset):
+        pass
+    if last_boundary is None or last_boundary[0] == b'-->' or last_boundary[1]:
+        return offset # Not inside a raw-text section
+    return 0
+
+def _parse_roster_containers(page_bytes):
+    """
+    Parses only the part of a team page (the raw response bytes) that holds the
+    ResponsiveTable containers and returns them as lxml elements (an empty list if the page has none).
+    Most of the page is nav, scripts, ads and footer, so instead of building a tree for
+    all of it (the SoupStrainer idea), the raw bytes are searched for the containers' opening
+    tags and fed to a pull parser from the first one until as many containers have closed.
+    """
+    offsets = _container_tag_offsets(page_bytes)
+    if not offsets:
+        # No container tag recognisable in the bytes; fall back to parsing the whole page
+        return _CONTAINERS_XPATH(html.fromstring(page_bytes, parser=_PAGE_PARSER))
+
+    # libxml2 keeps a multi-byte character split across two chunks intact
+    parser = etree.HTMLPullParser(events=('start', 'end'), tag='div', encoding=PAGE_ENCODING)
+    parser.set_element_class_lookup(html.HtmlElementClassLookup()) # text_content() and friends
+    open_containers = 0
+    closed_containers = 0
+    for offset in range(_feed_start(page_bytes, offsets[0]), len(page_bytes), _FEED_CHUNK_SIZE):
+        parser.feed(page_bytes[offset:offset + _FEED_CHUNK_SIZE])
+        for event, element in parser.read_events():
+            if _CONTAINER_CLASS in (element.get('class') or '').split():
+                if event == 'start':
+                    open_containers += 1
+                else:
+                    open_containers -= 1
+                    closed_containers += 1
+        if closed_containers >= len(offsets) and not open_containers:
+            break # Every container found in the bytes has been parsed; the rest of the page never is
+
+    # close() hands back the partial tree; the XPath returns the containers in page order
+    return _CONTAINERS_XPATH(parser.close())
+
+def get_roster_tables(url):
+    """
+    Fetches an ESPN team roster page and returns the main table containers
+    holding player data, as parsed lxml elements.
+    """
+    # print(f"Fetching roster data from {url}...") # Commented out to reduce console spam during full league scrape
+    try:
+        RATE_LIMITER.acquire() # Waits here if the threads are ahead of ESPN's admit rate
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
+        RATE_LIMITER.increase()
+
+        # The player tables are wrapped in 'ResponsiveTable' divs. NBA pages usually have one main
+        # roster table, NHL pages one per position group (Centers, Left Wings, ..., Goalies).
+        all_tables_containers = _parse_roster_containers(response.content)
+
+        if not all_tables_containers:
+            print(f"No 'ResponsiveTable' divs found on {url}. Page structure might be different. Skipping.")
+            return None
+
+        # Hand back the parsed containers themselves, so each page is parsed only once
+        # rather than serializing every container and re-parsing the string
+        return all_tables_containers
+
+    except requests.exceptions.RequestException as e:
+        print(f"Network or HTTP error for {url}: {e}")
+        return None
+    except Exception as e:
+        print(f"An unexpected error occurred for {url}: {e}")
+        return None
+
+def find_section_title(container):
+    """Returns the stripped text of a table container's Table__Title div, or None if it has none."""
+    title_tags = _TITLE_XPATH(container)
+    return title_tags[0].text_content().strip() if title_tags else None
+
+def find_player_link(cell):
+    """Returns the player's AnchorLink <a> element inside a name cell, or None."""
+    player_links = _PLAYER_LINK_XPATH(cell)
+    return player_links[0] if player_links else None
+
+def find_player_status(cell):
+    """
+    Returns the injury status shown in a name cell, or None.
+    Reads the injury-status span (often a sibling of the AnchorLink); failing that, falls back
+    to text in parentheses at the end of the cell (e.g. 'John Doe (DTD)').
+    """
+    status_text = _STATUS_TEXT_XPATH(cell).strip()
+    if status_text:
+        return status_text
+
+    cell_text_content = ' '.join(text.strip() for text in cell.itertext() if text.strip())
+    match = STATUS_RE.search(cell_text_content)
+    if match:
+        potential_status = match.group(1).strip()
+        # Basic filter to avoid jersey numbers or other non-status info
+        if not potential_status.isdigit() and len(potential_status) <= 10:
+            return potential_status
+    return None
+
+def cell_texts(cells):
+    """
+    Returns the stripped text of each cell's first <div> ('' for a cell without one).
+    Every cell is a single compiled XPath call, so libxml2 finds the div and joins its
+    text without an element being built for it on the Python side.
+    """
+    return [_DIV_TEXT_XPATH(cell).strip() for cell in cells]
+
+def write_players_to_csv(players, filename, fieldnames):
+    """
+    Writes player dictionaries to a CSV file as they arrive, so any iterable works
+    (e.g. a generator that is still fetching later teams) and the rows never have to be
+    collected into a list first.
+    Columns are written in fieldnames order.
+    Returns the number of player records written.
+    Each record is projected onto a tuple with one itemgetter call (in C) and written with a
+    plain csv.writer, rather than DictWriter building a fresh list from the dict per row.
+    """
+    players = iter(players)
+    first_player = next(players, None)
+    if first_player is None:
+        print("No player data to write to CSV.")
+        return 0
+
+    print(f"Writing player records to {filename}...")
+    players_written = 0
+    row_values = itemgetter(*fieldnames) # player dict -> tuple of its values in column order
+    try:
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerow(row_values(first_player))
+            players_written = 1
+            for player in players:
+                writer.writerow(row_values(player))
+                players_written += 1
+        print(f"CSV file successfully created with {players_written} player records.")
+    except Exception as e:
+        print(f"Error writing to CSV file {filename}: {e}")
+    return players_written
+
+def fetch_team_tables(team_name, info, base_url):
+    """
+    Downloads one team's roster page and returns its table containers, or None (runs on a fetch thread).
+    """
+    team_url = f"{base_url}{info['abbrev']}/{info['slug']}"
+    print(f"Processing roster for {team_name}...")
+    return get_roster_tables(team_url)
+
+def iter_league_players(config):
+    """
+    Fetches and parses every team's roster and yields each player record once, in team order.
+    Records stream straight out to the caller (the CSV writer) as each team is parsed,
+    instead of the whole league being gathered, deduplicated and written afterwards.
+    """
+    # --- Deduplication Logic (for roster) ---
+    # Players generally appear once on a roster. If a player is listed in multiple
+    # sections (e.g., as both LW and C if an NHL roster is split), this keeps the first
+    # entry encountered for that player on that team. Every record has depth_label
+    # "Roster", so there is no depth rank that could make a later entry win, and only
+    # the keys of the players already handed out need to be kept.
+    seen_players = set() # (player_name, team_name) of every record yielded so far
+
+    # All team pages are downloaded concurrently instead of one round trip after another.
+    # map() hands results back in team order, so the output doesn't depend on which
+    # download finishes first, and each team is parsed while the later teams are still downloading.
+    executor = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY)
+    try:
+        team_tables = executor.map(fetch_team_tables, config.teams.keys(), config.teams.values(), repeat(config.base_url))
+
+        for (team_name, info), roster_tables in zip(config.teams.items(), team_tables):
+            if roster_tables:
+                # Deduplicated as each player comes out of the parser, with no per-team list in between
+                players_parsed = 0
+                for player_data in config.iter_players(roster_tables, team_name, info["abbrev"]):
+                    players_parsed += 1
+                    player_key = (player_data['player_name'], player_data['team_name'])
+                    if player_key not in seen_players:
+                        seen_players.add(player_key)
+                        yield player_data
+                if players_parsed:
+                    print(f"Successfully parsed {players_parsed} players for {team_name}.")
+                else:
+                    print(f"No players parsed for {team_name}. Check the page structure and parsing logic.")
+            else:
+                print(f"Could not retrieve any relevant HTML tables/sections for {team_name}. Skipping.")
+            print("-" * 50) # Separator for readability
+    finally:
+        # If the scrape stops early (a write error, Ctrl+C), the pages not yet being
+        # fetched are dropped instead of downloaded for nothing
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def run(config):
+    """Scrapes every team in config and writes the deduplicated league roster to its CSV file."""
+    os.makedirs(config.output_directory, exist_ok=True) # Create the directory if it doesn't exist
+
+    output_csv_file = os.path.join(config.output_directory, config.output_filename)
+    try:
+        players_written = write_players_to_csv(iter_league_players(config), output_csv_file, config.fieldnames)
+    finally:
+        # Don't leave the pooled sockets to ESPN open once the scrape is over (or has failed)
+        clear_session()
+
+    if players_written:
+        print(f"\nAll {config.name} roster data collected, deduplicated, and saved to {output_csv_file}")
+    else:
+        print(f"\nNo {config.name} roster data was successfully collected for any team.")
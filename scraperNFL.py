@@ -1,61 +1,127 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from lxml import etree
 import os
 import json
-from xml.etree.ElementTree import Element, SubElement, tostring, Comment
-from xml.dom import minidom
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-def prettify(elem):
-    """Return a pretty-printed XML string for the Element."""
-    rough_string = tostring(elem, 'utf-8')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ")
+# Team pages being downloaded at once; keeps the scrape polite to ESPN
+FETCH_CONCURRENCY = 8
+# Seconds to wait on ESPN before giving up on a team page: (connecting, each read of the response)
+REQUEST_TIMEOUT = (5, 15)
 
-def get_depth_chart_tables(url):
+# ESPN serves its pages as UTF-8; libxml2 decodes the raw bytes itself
+PAGE_ENCODING = 'utf-8'
+# Bytes handed to the pull parser at a time
+_FEED_CHUNK_SIZE = 1 << 16
+# Write buffer for the saved table files (1 MiB), larger than any single table
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Connection errors, throttled (429) and 5xx responses are retried up to 3 times with
+# exponential backoff (0.3s, 0.6s, 1.2s), waiting longer if ESPN sends a Retry-After,
+# so a brief hiccup doesn't lose a team while a flood of retries doesn't make it worse
+RETRY_POLICY = Retry(
+    total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True
+)
+
+# One session for all 32 team pages, so the keep-alive connections to espn.com are reused
+# instead of doing a fresh TCP + TLS handshake per team. The pool holds exactly one
+# connection per fetch thread: none are opened only to be thrown away, and none sit idle.
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': ACCEPT_ENCODING, # Compressed pages; br only with brotli installed
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_CONCURRENCY, max_retries=RETRY_POLICY))
+
+def get_depth_chart_page(url):
     """
-    Fetch the ESPN depth chart page and return the raw HTML of the relevant tables.
-    Each table corresponds to a 'ResponsiveTable' div.
+    Fetch the ESPN depth chart page and return its raw bytes, or None if the request failed
+    or the page plainly has no depth chart tables.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     print(f"Fetching depth chart from {url}...")
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find all depth chart tables (ResponsiveTable containers)
+        # Already decompressed by urllib3, but not decoded: lxml decodes the bytes itself,
+        # so .text would decode the whole page a second time
+        page_bytes = response.content
+        # A page without the class name anywhere (an error page, a changed layout) can't have
+        # any tables; one substring search saves sending it to the parser pool at all
+        if b'ResponsiveTable' not in page_bytes:
+            print(f"No depth chart tables found for {url}. This might be a temporary issue or the page structure has changed.")
+            return None
+        return page_bytes
+    except requests.exceptions.RequestException as e:
+        print(f"Network or HTTP error for {url}: {e}")
+        return None
+    except Exception as e:
+        # Anything else (e.g. a body that fails to decompress) skips this team only,
+        # rather than escaping fetcher.map and ending the whole run
+        print(f"An unexpected error occurred for {url}: {e}")
+        return None
+
+def get_depth_chart_tables(page_bytes, url):
+    """
+    Return the raw HTML of the relevant tables in a fetched depth chart page.
+    Each table corresponds to a 'ResponsiveTable' div.
+    Runs in a worker process, since parsing is CPU-bound and would otherwise hold the GIL
+    while the remaining pages are still being downloaded.
+    """
+    try:
+        # Walk the page once with a pull parser instead of building a tree for all of it:
+        # each ResponsiveTable div is serialized as soon as it closes, and every other
+        # finished div outside a table is cleared and dropped from its parent along with the
+        # siblings before it, so the nav, ads and footer never pile up in memory.
+        parser = etree.HTMLPullParser(events=('start', 'end'), tag='div', encoding=PAGE_ENCODING)
         depth_charts_html = []
-        depth_charts = soup.find_all('div', class_='ResponsiveTable')
+        open_table_slots = [] # depth_charts_html index of every ResponsiveTable div we are inside of
+        for offset in range(0, len(page_bytes), _FEED_CHUNK_SIZE):
+            parser.feed(page_bytes[offset:offset + _FEED_CHUNK_SIZE])
+            for event, element in parser.read_events():
+                is_table = 'ResponsiveTable' in (element.get('class') or '').split()
+                if event == 'start':
+                    if is_table:
+                        # A table's slot is taken when it opens, so the list stays in page order
+                        # (rename_files maps table 1/2/3 to units by position) even if one table
+                        # is nested in another and so closes first
+                        open_table_slots.append(len(depth_charts_html))
+                        depth_charts_html.append(None)
+                    continue
+                if is_table:
+                    # Convert each ResponsiveTable div to its HTML string representation
+                    # (without the text that follows its closing tag)
+                    depth_charts_html[open_table_slots.pop()] = etree.tostring(
+                        element, method='html', encoding='unicode', with_tail=False)
+                if not open_table_slots:
+                    element.clear()
+                    parent = element.getparent()
+                    if parent is not None:
+                        while element.getprevious() is not None:
+                            del parent[0]
+        parser.close()
         
-        if not depth_charts:
+        if not depth_charts_html:
             print(f"No depth chart tables found for {url}. This might be a temporary issue or the page structure has changed.")
             return None
-
-        for chart in depth_charts:
-            # Convert each ResponsiveTable div to its HTML string representation
-            # .prettify() helps with readable output
-            depth_charts_html.append(chart.prettify())
         
         return depth_charts_html
         
-    except requests.exceptions.RequestException as e:
-        print(f"Network or HTTP error for {url}: {e}")
-        return None
     except Exception as e:
         print(f"An unexpected error occurred for {url}: {e}")
         return None
 
 def tables_to_xml(tables, team_name, team_abbrev):
     """
-    Convert the tables data structure to XML (kept for reference, not used in main execution as per request).
-    This function is unchanged and remains for potential future use if XML output is desired again.
+    Convert the tables data structure to a pretty-printed XML string (kept for reference, not used in main execution as per request).
+    This function remains for potential future use if XML output is desired again. The tree is built
+    with lxml, which indents it while serializing, so no minidom re-parse is needed for readable output.
     """
-    root = Element('DepthChart')
-    team = SubElement(root, 'Team', name=team_name, abbreviation=team_abbrev)
+    root = etree.Element('DepthChart')
+    team = etree.SubElement(root, 'Team', name=team_name, abbreviation=team_abbrev)
     
     # Group tables by type (Offense, Defense, Special Teams)
     for table in tables: # Note: 'tables' here would need to be the parsed JSON-like structure, not raw HTML
@@ -72,27 +138,27 @@ def tables_to_xml(tables, team_name, team_abbrev):
         # Find or create the group element
         group = team.find(f"PositionGroup[@name='{group_name}']")
         if group is None:
-            group = SubElement(team, 'PositionGroup', name=group_name)
+            group = etree.SubElement(team, 'PositionGroup', name=group_name)
         
         # Add formation as a comment
         formation_comment = f" Formation: {title} "
-        group.append(Comment(formation_comment))
+        group.append(etree.Comment(formation_comment))
         
         # Add each position
         for pos, players in zip(table['positions'], table['players']):
-            position = SubElement(group, 'Position', name=pos)
+            position = etree.SubElement(group, 'Position', name=pos)
             
             for depth, player in enumerate(players, 1):
                 if player is None:
                     continue
                 
-                player_elem = SubElement(position, 'Player')
-                SubElement(player_elem, 'Depth').text = str(depth)
-                SubElement(player_elem, 'Name').text = player['name']
+                player_elem = etree.SubElement(position, 'Player')
+                etree.SubElement(player_elem, 'Depth').text = str(depth)
+                etree.SubElement(player_elem, 'Name').text = player['name']
                 if player['status']:
-                    SubElement(player_elem, 'Status').text = player['status']
+                    etree.SubElement(player_elem, 'Status').text = player['status']
     
-    return root
+    return etree.tostring(root, pretty_print=True, encoding='unicode')
 
 # Main execution
 if __name__ == "__main__":
@@ -137,23 +203,36 @@ if __name__ == "__main__":
 
     base_url = "https://www.espn.com/nfl/team/depth/_/name/"
 
-    for team_name, info in nfl_teams.items():
-        abbrev = info["abbrev"]
-        slug = info["slug"]
-        team_url = f"{base_url}{abbrev}/{slug}"
+    team_urls = [f"{base_url}{info['abbrev']}/{info['slug']}" for info in nfl_teams.values()]
 
-        # Now get_depth_chart_tables returns a list of HTML strings
-        raw_html_tables = get_depth_chart_tables(team_url)
-        
-        if raw_html_tables:
-            # Save each table as a separate HTML file
-            for i, table_html in enumerate(raw_html_tables):
-                output_file = os.path.join(output_directory, f"{slug}_depth_chart_table_{i+1}.html")
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(table_html)
-                
-                print(f"Successfully saved table {i+1} for {team_name} to {output_file}")
-        else:
-            print(f"Failed to retrieve any depth chart tables for {team_name}")
-        print("-" * 50) # Separator for readability
+    # All 32 pages are downloaded concurrently instead of one round trip after another,
+    # and each page is handed to the process pool for parsing as soon as it arrives, so
+    # parsing overlaps with the downloads still in flight. map() hands pages back in team
+    # order, so files are saved and logged team by team regardless of which finishes first.
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as fetcher, \
+         ProcessPoolExecutor(max_workers=os.cpu_count()) as parser:
+        parse_futures = [
+            parser.submit(get_depth_chart_tables, page_bytes, team_url) if page_bytes is not None else None
+            for team_url, page_bytes in zip(team_urls, fetcher.map(get_depth_chart_page, team_urls))
+        ]
+
+        for (team_name, info), future in zip(nfl_teams.items(), parse_futures):
+            slug = info["slug"]
+            raw_html_tables = future.result() if future is not None else None
+
+            if raw_html_tables:
+                # Save each table as a separate HTML file. The paths are worked out first and the
+                # files then written back to back, each through a buffer big enough to take the
+                # whole table, so every file goes to disk in a single write.
+                table_files = [
+                    (os.path.join(output_directory, f"{slug}_depth_chart_table_{i+1}.html"), table_html)
+                    for i, table_html in enumerate(raw_html_tables)
+                ]
+                for i, (output_file, table_html) in enumerate(table_files, 1):
+                    with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                        f.write(table_html)
+                    
+                    print(f"Successfully saved table {i} for {team_name} to {output_file}")
+            else:
+                print(f"Failed to retrieve any depth chart tables for {team_name}")
+            print("-" * 50) # Separator for readability
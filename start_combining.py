@@ -1,6 +1,210 @@
 import os
 import csv
+import io
+import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from heapq import nsmallest
+from itertools import repeat
+from operator import itemgetter
+
+# Define processing order and priority for units
+# Lower number indicates higher priority
+UNIT_PRIORITY_MAP = {
+    "_offense.csv": 1,
+    "_defense.csv": 2,
+    "_special_teams.csv": 3
+}
+
+# Unit CSV names as the processers write them: <team_slug>_depth_chart<UNIT_PRIORITY_MAP suffix>
+UNIT_FILE_PATTERN = re.compile(
+    r'^(?P<slug>.+)_depth_chart(?P<unit>' + '|'.join(map(re.escape, UNIT_PRIORITY_MAP)) + r')$'
+)
+
+# Looked up once here rather than on every get_position_sort_key call
+SPECIAL_TEAMS_PRIORITY = UNIT_PRIORITY_MAP["_special_teams.csv"]
+
+# Define specific position priority within Special Teams
+# Lower number indicates higher priority
+SPECIAL_TEAMS_POSITION_ORDER = {
+    'PK': 1,  # Place kicker
+    'P': 2,   # Punter (prioritized over H)
+    'H': 3,   # Holder
+    'LS': 4,  # Long snapper
+    'PR': 5,  # Punt Returner
+    'KR': 6,  # Kick Returner
+    # Add other special teams positions if needed with appropriate priorities
+}
+
+# Buffer size for reading the unit CSVs and writing the combined one (1 MiB): a whole
+# file fits, so each is read or written in one syscall rather than in 8 KiB pieces
+IO_BUFFER_SIZE = 1 << 20
+
+# Columns read from each unit CSV, in the order process_team unpacks them
+INPUT_COLUMNS = ('PlayerUID', 'PlayerName', 'PlayerURL', 'InjuryStatus', 'Position', 'Depth')
+
+def get_position_sort_key(unit_prio, position_name, depth):
+    """
+    Ordering key for one of a player's (unit_priority, position_name, depth) entries:
+    unit first, then position (SPECIAL_TEAMS_POSITION_ORDER within special teams,
+    alphabetical otherwise), then depth.
+    """
+    # Apply special teams position specific priority only if it's a special teams unit
+    if unit_prio == SPECIAL_TEAMS_PRIORITY:
+        # Use defined order for special teams positions, default to high value if not in map
+        pos_order_value = SPECIAL_TEAMS_POSITION_ORDER.get(position_name, 999) 
+        return (unit_prio, pos_order_value, depth)
+    else:
+        # For offense/defense, use alphabetical sort for position name
+        return (unit_prio, position_name, depth)
+
+class PlayerRecord:
+    """
+    One player's consolidated data for a team's combined CSV.
+    all_positions is a list of tuples: (sort_key, position_name, depth), where sort_key is
+    get_position_sort_key for the entry's unit, position and depth, worked out once as the row is read.
+    pos_seen holds the (unit_priority, position_name, depth) keys already in all_positions; it isn't written out.
+    __slots__ keeps each record a small fixed struct rather than a per-player dict.
+    """
+    __slots__ = ('TeamName', 'PlayerName', 'PlayerURL', 'PlayerUID', 'InjuryStatus', 'all_positions', 'pos_seen')
+
+    def __init__(self, team_name):
+        self.TeamName = team_name
+        self.PlayerName = ''
+        self.PlayerURL = ''
+        self.PlayerUID = '' # Explicitly store UID on the record for clarity
+        self.InjuryStatus = ''
+        self.all_positions = []
+        self.pos_seen = set()
+
+def process_team(team_slug, files_info, output_combined_directory):
+    """
+    Combines one team's unit CSVs (files_info maps a UNIT_PRIORITY_MAP suffix to its
+    CSV path) into <team_slug>_combined_depth_chart.csv in output_combined_directory.
+    Teams are independent of each other, so this can run on its own for each team.
+    Returns True if the combined CSV was written.
+    """
+    team_name = team_slug.replace("-", " ").title()
+    print(f"\n--- Combining data for {team_name} ({team_slug}) ---")
+
+    # Dict to store consolidated player data for this team
+    # Key: PlayerUID (should be unique), Value: PlayerRecord with the player's attributes + list of positions
+    consolidated_players = {}
+
+    # Process files in unit priority order
+    sorted_file_types = sorted(files_info.keys(), key=lambda x: UNIT_PRIORITY_MAP.get(x, 999))
+
+    for file_type_suffix in sorted_file_types:
+        filepath = files_info[file_type_suffix]
+        if not filepath:
+            continue
+
+        try:
+            with open(filepath, 'r', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE) as f:
+                # Plain csv.reader: rows come back as lists, and the columns are picked out by
+                # index in one itemgetter call, instead of DictReader building a dict per row
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if header is None:
+                    continue # Empty file
+                try:
+                    get_fields = itemgetter(*(header.index(column) for column in INPUT_COLUMNS))
+                except ValueError:
+                    print(f"  Warning: {filepath} is missing one of the columns {', '.join(INPUT_COLUMNS)}. Skipping.")
+                    continue
+                row_width = len(header)
+                current_unit_priority = UNIT_PRIORITY_MAP.get(file_type_suffix, 999)
+
+                for row in reader:
+                    if len(row) < row_width:
+                        continue # Blank or truncated line
+                    player_uid, player_name, player_url, injury_status, position, depth = get_fields(row)
+
+                    if not player_uid or player_name == '-' or position == 'Empty Slot': # Handle empty player slots
+                        continue
+                    
+                    # Looked up (or added) once, then used through the local for the rest of the row
+                    player = consolidated_players.get(player_uid)
+                    if player is None:
+                        player = consolidated_players[player_uid] = PlayerRecord(team_name)
+
+                    # Populate primary player info if not already set, or update if more complete
+                    # For players appearing multiple times, the info from the first occurrence (highest priority unit)
+                    # will generally stick, or if previous was an empty slot.
+                    if not player.PlayerName or player.PlayerName == 'Empty Slot':
+                        player.PlayerName = player_name
+                        player.PlayerURL = player_url
+                        player.PlayerUID = player_uid
+                        player.InjuryStatus = injury_status if injury_status != 'Empty Slot' else ''
+                    elif player.InjuryStatus == 'Empty Slot' and injury_status != 'Empty Slot':
+                        player.InjuryStatus = injury_status # Update status if a real status is found
+
+                    # Add this position and depth to the player's list
+                    if position and depth:
+                         # Prevent duplicate position entries if a player is listed twice in the same unit
+                        # (checked against the pos_seen set, rather than scanning the list)
+                        position_key = (current_unit_priority, position, depth)
+                        if position_key not in player.pos_seen:
+                            player.pos_seen.add(position_key)
+                            player.all_positions.append(
+                                (get_position_sort_key(current_unit_priority, position, depth), position, depth))
+
+        except FileNotFoundError:
+            print(f"  Warning: File not found: {filepath}")
+        except Exception as e:
+            print(f"  Error reading {filepath}: {e}")
+
+    # Prepare data for output CSV
+    output_rows = []
+    header = ['TeamName', 'PrimaryPosition', 'PrimaryDepth', 'PlayerName', 'PlayerURL', 'PlayerUID', 'InjuryStatus', 
+              'Position2', 'Depth2', 'Position3', 'Depth3']
+    output_rows.append(header)
+
+    for player_uid, player_data in sorted(consolidated_players.items()): # Sort by UID for consistent output order
+        
+        # Only the best three positions are written out, so pick those on their precomputed key
+        # instead of sorting the whole list (nsmallest is stable on ties, like sort)
+        top_positions = nsmallest(3, player_data.all_positions, key=itemgetter(0))
+        top_positions += [(None, None, None)] * (3 - len(top_positions))
+        primary_pos, secondary_pos, tertiary_pos = top_positions
+
+        row = [
+            player_data.TeamName,
+            primary_pos[1] if primary_pos[1] else '', # PrimaryPosition
+            primary_pos[2] if primary_pos[2] else '', # PrimaryDepth
+            player_data.PlayerName,
+            player_data.PlayerURL,
+            player_data.PlayerUID,
+            player_data.InjuryStatus
+        ]
+        
+        # Add secondary and tertiary positions
+        row.extend([
+            secondary_pos[1] if secondary_pos[1] else '',
+            secondary_pos[2] if secondary_pos[2] else ''
+        ])
+        row.extend([
+            tertiary_pos[1] if tertiary_pos[1] else '',
+            tertiary_pos[2] if tertiary_pos[2] else ''
+        ])
+        
+        output_rows.append(row)
+    
+    # Write combined CSV for the team
+    output_filename = f"{team_slug}_combined_depth_chart.csv"
+    output_filepath = os.path.join(output_combined_directory, output_filename)
+    
+    try:
+        # Format the whole CSV in memory first, then hand it to the file in a single write
+        buffer = io.StringIO(newline='')
+        csv.writer(buffer).writerows(output_rows)
+        with open(output_filepath, 'w', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE) as f:
+            f.write(buffer.getvalue())
+        print(f"  Successfully combined and saved to {output_filepath}")
+        return True
+    except Exception as e:
+        print(f"  Error writing combined CSV for {team_name}: {e}")
+        return False
 
 def combine_team_depth_charts(input_csv_directory="team_CSV", output_combined_directory="combined_depth_charts"):
     """
@@ -17,178 +221,25 @@ def combine_team_depth_charts(input_csv_directory="team_CSV", output_combined_di
     print(f"Reading CSVs from: {input_csv_directory}")
     print(f"Saving combined CSVs to: {output_combined_directory}")
 
-    # Define processing order and priority for units
-    # Lower number indicates higher priority
-    unit_priority_map = {
-        "_offense.csv": 1,
-        "_defense.csv": 2,
-        "_special_teams.csv": 3
-    }
-
-    # Define specific position priority within Special Teams
-    # Lower number indicates higher priority
-    special_teams_position_order = {
-        'PK': 1,  # Place kicker
-        'P': 2,   # Punter (prioritized over H)
-        'H': 3,   # Holder
-        'LS': 4,  # Long snapper
-        'PR': 5,  # Punt Returner
-        'KR': 6,  # Kick Returner
-        # Add other special teams positions if needed with appropriate priorities
-    }
-
     # Group files by team slug
     team_files = defaultdict(lambda: defaultdict(str)) # team_slug -> {file_type_suffix: filepath}
-    for filename in os.listdir(input_csv_directory):
-        if filename.endswith(".csv"):
-            parts = filename.split('_depth_chart_')
-            if len(parts) == 2:
-                team_slug = parts[0]
-                file_type_suffix = f"_{parts[1]}" # e.g., "_offense.csv", "_defense.csv"
-                
-                # Check if this file type is one we care about for priority
-                found_type = False
-                for suffix_key in unit_priority_map.keys():
-                    if file_type_suffix.startswith(suffix_key):
-                        team_files[team_slug][suffix_key] = os.path.join(input_csv_directory, filename)
-                        found_type = True
-                        break
-                if not found_type:
-                    print(f"Warning: Skipping unrecognized CSV file type: {filename}")
-
-    processed_teams_count = 0
-    
-    # Process each team
-    for team_slug, files_info in team_files.items():
-        team_name = team_slug.replace("-", " ").title()
-        print(f"\n--- Combining data for {team_name} ({team_slug}) ---")
-
-        # Dict to store consolidated player data for this team
-        # Key: PlayerUID (should be unique), Value: Dict of player attributes + list of positions
-        # Example: { 's:20~l:28~a:3917315': { 'TeamName': '...', 'PlayerName': '...', 'PlayerURL': '...', 'InjuryStatus': '...', 'all_positions': [] } }
-        # 'all_positions' will be a list of tuples: (unit_priority, position_name, depth)
-        consolidated_players = defaultdict(lambda: {
-            'TeamName': team_name,
-            'PlayerName': '',
-            'PlayerURL': '',
-            'PlayerUID': '', # Explicitly store UID in the dict for clarity
-            'InjuryStatus': '',
-            'all_positions': [] # Store (unit_priority, position_name, depth)
-        })
-
-        # Process files in unit priority order
-        sorted_file_types = sorted(files_info.keys(), key=lambda x: unit_priority_map.get(x, 999))
-
-        for file_type_suffix in sorted_file_types:
-            filepath = files_info[file_type_suffix]
-            if not filepath:
-                continue
-
-            try:
-                with open(filepath, 'r', encoding='utf-8', newline='') as f:
-                    reader = csv.DictReader(f)
-                    current_unit_priority = unit_priority_map.get(file_type_suffix, 999)
-
-                    for row in reader:
-                        player_uid = row.get('PlayerUID')
-                        player_name = row.get('PlayerName')
-                        player_url = row.get('PlayerURL')
-                        injury_status = row.get('InjuryStatus')
-                        position = row.get('Position')
-                        depth = row.get('Depth')
-
-                        if not player_uid or player_name == '-' or position == 'Empty Slot': # Handle empty player slots
-                            continue
-                        
-                        # Populate primary player info if not already set, or update if more complete
-                        # For players appearing multiple times, the info from the first occurrence (highest priority unit)
-                        # will generally stick, or if previous was an empty slot.
-                        if not consolidated_players[player_uid]['PlayerName'] or \
-                           consolidated_players[player_uid]['PlayerName'] == 'Empty Slot':
-                            consolidated_players[player_uid]['PlayerName'] = player_name
-                            consolidated_players[player_uid]['PlayerURL'] = player_url
-                            consolidated_players[player_uid]['PlayerUID'] = player_uid
-                            consolidated_players[player_uid]['InjuryStatus'] = injury_status if injury_status != 'Empty Slot' else ''
-                        elif consolidated_players[player_uid]['InjuryStatus'] == 'Empty Slot' and injury_status != 'Empty Slot':
-                            consolidated_players[player_uid]['InjuryStatus'] = injury_status # Update status if a real status is found
-
-                        # Add this position and depth to the player's list
-                        if position and depth:
-                             # Prevent duplicate position entries if a player is listed twice in the same unit
-                            if (current_unit_priority, position, depth) not in consolidated_players[player_uid]['all_positions']:
-                                consolidated_players[player_uid]['all_positions'].append((current_unit_priority, position, depth))
-
-            except FileNotFoundError:
-                print(f"  Warning: File not found: {filepath}")
-            except Exception as e:
-                print(f"  Error reading {filepath}: {e}")
-
-        # Prepare data for output CSV
-        output_rows = []
-        header = ['TeamName', 'PrimaryPosition', 'PrimaryDepth', 'PlayerName', 'PlayerURL', 'PlayerUID', 'InjuryStatus', 
-                  'Position2', 'Depth2', 'Position3', 'Depth3']
-        output_rows.append(header)
-
-        # Custom sorting key for player positions
-        def get_position_sort_key(pos_tuple):
-            unit_prio = pos_tuple[0]
-            position_name = pos_tuple[1]
-            depth = pos_tuple[2]
-
-            # Apply special teams position specific priority only if it's a special teams unit
-            if unit_prio == unit_priority_map["_special_teams.csv"]:
-                # Use defined order for special teams positions, default to high value if not in map
-                pos_order_value = special_teams_position_order.get(position_name, 999) 
-                return (unit_prio, pos_order_value, depth)
-            else:
-                # For offense/defense, use alphabetical sort for position name
-                return (unit_prio, position_name, depth)
-
-
-        for player_uid in sorted(consolidated_players.keys()): # Sort by UID for consistent output order
-            player_data = consolidated_players[player_uid]
-            
-            # Sort positions using the custom key
-            player_data['all_positions'].sort(key=get_position_sort_key) 
-
-            primary_pos = player_data['all_positions'][0] if player_data['all_positions'] else (None, None, None)
-            secondary_pos = player_data['all_positions'][1] if len(player_data['all_positions']) > 1 else (None, None, None)
-            tertiary_pos = player_data['all_positions'][2] if len(player_data['all_positions']) > 2 else (None, None, None)
-
-            row = [
-                player_data['TeamName'],
-                primary_pos[1] if primary_pos[1] else '', # PrimaryPosition
-                primary_pos[2] if primary_pos[2] else '', # PrimaryDepth
-                player_data['PlayerName'],
-                player_data['PlayerURL'],
-                player_data['PlayerUID'],
-                player_data['InjuryStatus']
-            ]
-            
-            # Add secondary and tertiary positions
-            row.extend([
-                secondary_pos[1] if secondary_pos[1] else '',
-                secondary_pos[2] if secondary_pos[2] else ''
-            ])
-            row.extend([
-                tertiary_pos[1] if tertiary_pos[1] else '',
-                tertiary_pos[2] if tertiary_pos[2] else ''
-            ])
-            
-            output_rows.append(row)
-        
-        # Write combined CSV for the team
-        output_filename = f"{team_slug}_combined_depth_chart.csv"
-        output_filepath = os.path.join(output_combined_directory, output_filename)
-        
-        try:
-            with open(output_filepath, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerows(output_rows)
-            print(f"  Successfully combined and saved to {output_filepath}")
-            processed_teams_count += 1
-        except Exception as e:
-            print(f"  Error writing combined CSV for {team_name}: {e}")
+    # scandir's entries carry their full path already, so no os.path.join per file
+    with os.scandir(input_csv_directory) as entries:
+        for entry in entries:
+            # One regex match gives both the team slug and the unit suffix
+            match = UNIT_FILE_PATTERN.match(entry.name)
+            if match:
+                team_files[match['slug']][match['unit']] = entry.path
+            elif entry.name.endswith(".csv") and '_depth_chart_' in entry.name:
+                print(f"Warning: Skipping unrecognized CSV file type: {entry.name}")
+
+    # Teams are independent (the maps above are only ever read), so each one is
+    # combined in its own worker process instead of one after another on one core
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(process_team, team_files.keys(), team_files.values(),
+                                    repeat(output_combined_directory)))
+
+    processed_teams_count = sum(results)
 
     print("\n--- Combination Summary ---")
     print(f"Teams processed: {processed_teams_count}")
@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import master_combine
+
+class CreateMasterDepthChartCsvTest(unittest.TestCase):
+    def _combine(self, files):
+        """Writes files ({name: bytes}) to a temp directory, combines them and returns the master CSV bytes."""
+        with tempfile.TemporaryDirectory() as directory:
+            for name, content in files.items():
+                with open(os.path.join(directory, name), 'wb') as f:
+                    f.write(content)
+            with redirect_stdout(StringIO()):
+                master_combine.create_master_depth_chart_csv(directory)
+            with open(os.path.join(directory, "master_nfl_depth_chart.csv"), 'rb') as f:
+                return f.read()
+
+    def test_empty_team_file_does_not_replace_the_header(self):
+        master = self._combine({
+            "a-team_combined_depth_chart.csv": b'',
+            "b-team_combined_depth_chart.csv": b'H1,H2\r\n1,2\r\n',
+        })
+        self.assertEqual(master, b'H1,H2\r\n1,2\r\n')
+
+    def test_unterminated_last_line_is_not_glued_to_the_next_team(self):
+        master = self._combine({
+            "a-team_combined_depth_chart.csv": b'H1,H2\r\n1,2',
+            "b-team_combined_depth_chart.csv": b'H1,H2\r\n3,4\r\n',
+        })
+        self.assertEqual(master, b'H1,H2\r\n1,2\r\n3,4\r\n')
+
+if __name__ == "__main__":
+    unittest.main()